@@ -1,54 +1,162 @@
 import asyncio
+import atexit
+import io
 import logging
 import os
+import queue
 import sys
+import threading
 from logging import handlers
 from pathlib import Path
 
 import coloredlogs
 
-# Setup some parameters for logging
-format_string = "%(asctime)s | %(name)s | %(levelname)s | %(message)s"
-log_level = logging.DEBUG
-log_format = logging.Formatter(format_string)
 
-# Setup logging file
+class BufferedRotatingFileHandler(handlers.RotatingFileHandler):
+    """
+    A `RotatingFileHandler` which buffers the written records instead of flushing them one by one.
+
+    The buffer is flushed once it's full, every `flush_interval` seconds and immediately
+    after records of `flush_level` or higher, so that no errors are lost on a crash.
+    """
+
+    def __init__(
+        self,
+        *args,
+        buffer_size: int = io.DEFAULT_BUFFER_SIZE * 8,
+        flush_interval: float = 30,
+        flush_level: int = logging.ERROR,
+        **kwargs
+    ):
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+        super().__init__(*args, **kwargs)
+
+        self._stop_flushing = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_periodically, name="log-flusher", daemon=True)
+        self._flusher.start()
+
+    def _open(self) -> io.TextIOWrapper:
+        """Open the log file with a write buffer of `buffer_size` bytes."""
+        stream = open(self.baseFilename, self.mode, buffering=self.buffer_size, encoding=self.encoding)
+        self._size = os.fstat(stream.fileno()).st_size
+        return stream
+
+    def _flush_periodically(self) -> None:
+        """Flush the buffer every `flush_interval` seconds, until the handler is closed."""
+        while not self._stop_flushing.wait(self.flush_interval):
+            self.flush()
+
+    def _encoded_length(self, msg: str) -> int:
+        """Get the amount of bytes the message takes up in the log file."""
+        return len(msg.encode(self.stream.encoding, self.stream.errors))
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        """
+        Determine if the record would make the file exceed its size limit.
+
+        Unlike the base implementation, this uses the tracked file size, since seeking
+        or calling `tell` on the stream would flush the buffer on every record.
+        """
+        if self.stream is None:
+            self.stream = self._open()
+        if self.maxBytes > 0:
+            msg = f"{self.format(record)}{self.terminator}"
+            if self._size + self._encoded_length(msg) >= self.maxBytes:
+                return True
+        return False
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write the record into the buffer, only flushing it for records of `flush_level` or higher."""
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            msg = f"{self.format(record)}{self.terminator}"
+            self.stream.write(msg)
+            self._size += self._encoded_length(msg)
+            if record.levelno >= self.flush_level:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def close(self) -> None:
+        """Stop the periodic flushing and close the file."""
+        self._stop_flushing.set()
+        super().close()
+
+
+# Some parameters for logging
+format_string = "%(asctime)s | %(name)s | %(levelname)s | %(message)s"
+# The level can be overridden with the LOG_LEVEL environmental variable (e.g. LOG_LEVEL=DEBUG)
+log_level = os.getenv("LOG_LEVEL", "INFO").upper()
 log_file = Path("logs", "bot.log")
-log_file.parent.mkdir(exist_ok=True)
-file_handler = handlers.RotatingFileHandler(
-    log_file, maxBytes=5242880, backupCount=7)
-file_handler.setFormatter(log_format)
-
-# Setup root_logger
-root_logger = logging.getLogger()
-root_logger.setLevel(log_level)
-root_logger.addHandler(file_handler)
-
-# Some formatting for coloredlogs
-coloredlogs.DEFAULT_LEVEL_STYLES = {
-    **coloredlogs.DEFAULT_LEVEL_STYLES,
-    "critical": {"background": "red"},
-    "debug": coloredlogs.DEFAULT_LEVEL_STYLES["info"]
-}
-
-coloredlogs.DEFAULT_LOG_FORMAT = format_string
-coloredlogs.DEFAULT_LOG_LEVEL = log_level
-
-coloredlogs.install(logger=root_logger, stream=sys.stdout)
-
-# Set other logging levels on imported modules
-logging.getLogger("discord").setLevel(logging.WARNING)
-logging.getLogger("websockets").setLevel(logging.WARNING)
-logging.getLogger("deepdiff").setLevel(logging.WARNING)
-logging.getLogger("asyncio").setLevel(logging.INFO)
-logging.getLogger("bot.utils.checks").setLevel(logging.INFO)
-logging.getLogger("bot.pagination").setLevel(logging.INFO)
-logging.getLogger("bot.utils.infractions").setLevel(logging.INFO)
-logging.getLogger("bot.utils.scheduling").setLevel(logging.INFO)
-logging.getLogger("bot.decorators").setLevel(logging.INFO)
-
-logging.getLogger(__name__)
-
-# On Windows, the selector event loop is required for aiodns.
-if os.name == "nt":
-    asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+
+
+def configure_logging() -> None:
+    """
+    Set up the root logger to log into the console and into the log file.
+
+    This is only called when running the bot, so that just importing `bot` has no side effects.
+    """
+    log_format = logging.Formatter(format_string)
+
+    # Setup logging file
+    log_file.parent.mkdir(exist_ok=True)
+    file_handler = BufferedRotatingFileHandler(
+        log_file, maxBytes=5242880, backupCount=7)
+    file_handler.setFormatter(log_format)
+
+    # Write the log file from a background thread, so that logging never blocks the event loop on disk I/O
+    log_queue = queue.Queue(-1)
+    queue_handler = handlers.QueueHandler(log_queue)
+    queue_listener = handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+    queue_listener.start()
+    atexit.register(queue_listener.stop)
+
+    # Setup root_logger
+    root_logger = logging.getLogger()
+    root_logger.setLevel(log_level)
+    root_logger.addHandler(queue_handler)
+
+    # Some formatting for coloredlogs
+    coloredlogs.DEFAULT_LEVEL_STYLES = {
+        **coloredlogs.DEFAULT_LEVEL_STYLES,
+        "critical": {"background": "red"},
+        "debug": coloredlogs.DEFAULT_LEVEL_STYLES["info"]
+    }
+
+    coloredlogs.DEFAULT_LOG_FORMAT = format_string
+    coloredlogs.DEFAULT_LOG_LEVEL = log_level
+
+    coloredlogs.install(logger=root_logger, stream=sys.stdout)
+
+    # Set other logging levels on imported modules
+    logging.getLogger("discord").setLevel(logging.WARNING)
+    logging.getLogger("websockets").setLevel(logging.WARNING)
+    logging.getLogger("deepdiff").setLevel(logging.WARNING)
+    logging.getLogger("asyncio").setLevel(logging.INFO)
+    logging.getLogger("bot.utils.checks").setLevel(logging.INFO)
+    logging.getLogger("bot.pagination").setLevel(logging.INFO)
+    logging.getLogger("bot.utils.infractions").setLevel(logging.INFO)
+    logging.getLogger("bot.utils.scheduling").setLevel(logging.INFO)
+    logging.getLogger("bot.decorators").setLevel(logging.INFO)
+
+
+def configure_event_loop() -> None:
+    """Set the event loop policy, this has to be done before the bot (and its loop) is created."""
+    # On Windows, the selector event loop is required for aiodns.
+    if os.name == "nt":
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    # Elsewhere, use the faster libuv based event loop if it's installed.
+    else:
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
@@ -2,40 +2,53 @@ import logging
 
 import discord
 
-from bot import constants
+from bot import configure_event_loop, configure_logging, constants
 from bot.bot import Bot
-from bot.database import SQLite
 
 log = logging.getLogger("bot")
 
-client = Bot(
-    command_prefix=constants.Bot.prefix,
-    activity=discord.Game(name="Use !help"),
-    case_insensitivity=True
+# Extensions which don't need the guild cache, these are loaded before connecting
+CORE_EXTENSIONS = (
+    "bot.cogs.error_handler",
+    "bot.cogs.security",
+    "bot.cogs.help",
 )
 
-db = SQLite()
-db.create_init_tables()
-db.close()
+# Extensions which work with the guild, these are loaded once the guild is available
+GUILD_EXTENSIONS = (
+    "bot.cogs.moderation",
+    "bot.cogs.information",
+    "bot.cogs.clean",
+    "bot.cogs.announcements",
+    "bot.cogs.embeds",
+    "bot.cogs.fun",
+)
+
+
+def main() -> None:
+    """Set up logging, create the bot and run it."""
+    configure_logging()
+    configure_event_loop()
 
+    client = Bot(
+        command_prefix=constants.Bot.prefix,
+        activity=discord.Game(name="Use !help"),
+        case_insensitivity=True,
+        extensions=CORE_EXTENSIONS
+    )
 
-@client.event
-async def on_ready():
-    log.info("Bot is ready")
+    for extension in GUILD_EXTENSIONS:
+        client.queue_extension(extension)
 
+    @client.event
+    async def on_ready():
+        log.info("Bot is ready")
 
-client.load_extension("bot.cogs.error_handler")
-client.load_extension("bot.cogs.security")
-client.load_extension("bot.cogs.help")
-client.load_extension("bot.cogs.moderation")
+    if constants.Bot.token:
+        client.run(constants.Bot.token)
+    else:
+        log.error("Bot token not found")
 
-client.load_extension("bot.cogs.information")
-client.load_extension("bot.cogs.clean")
-client.load_extension("bot.cogs.announcements")
-client.load_extension("bot.cogs.embeds")
-client.load_extension("bot.cogs.fun")
 
-if constants.Bot.token:
-    client.run(constants.Bot.token)
-else:
-    log.error("Bot token not found")
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,16 @@
 import asyncio
+import importlib
 import logging
+import sqlite3
+import typing as t
 
+import aiohttp
 import discord
+import orjson
 from discord.ext import commands
 
 from bot import constants
+from bot.database import SQLite
 
 log = logging.getLogger("bot")
 
@@ -12,15 +18,96 @@ log = logging.getLogger("bot")
 class Bot(commands.Bot):
     """A subclass of `discord.ext.commands.Bot` with some added functionality"""
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, extensions: t.Iterable[str] = (), **kwargs):
         super().__init__(*args, **kwargs)
 
         self._guild_available = asyncio.Event()
+        self._startup_extensions = tuple(extensions)
+        self._pending_extensions: t.List[str] = []
+        self._database_ready: t.Optional[asyncio.Future] = None
+        # Shared by all of the cogs, created once the event loop is running
+        self.http_session: t.Optional[aiohttp.ClientSession] = None
+
+    async def start(self, *args, **kwargs) -> None:
+        """Run `setup_hook` before logging in and connecting to the gateway."""
+        await self.setup_hook()
+        await super().start(*args, **kwargs)
+
+    async def setup_hook(self) -> None:
+        """
+        Load the startup extensions, this is ran once, before the bot connects.
+
+        The database tables are created in the background, while connecting. Extensions added
+        with `queue_extension` are loaded later, once the guild is available and the database is ready.
+        """
+        self._recreate()
+        self._database_ready = self.loop.run_in_executor(None, self._create_init_tables)
+        await self.load_extensions(*self._startup_extensions)
+        self.loop.create_task(self._deferred_load())
+
+    @staticmethod
+    def _create_init_tables() -> None:
+        """Make sure that all of the database tables exist."""
+        db = SQLite()
+        try:
+            db.create_init_tables()
+        finally:
+            db.close()
+
+    def queue_extension(self, name: str) -> None:
+        """Queue an extension to be loaded once the constants.Guild.id guild is available."""
+        self._pending_extensions.append(name)
+
+    async def _deferred_load(self) -> None:
+        """Wait until the guild cache is ready and load all of the queued extensions."""
+        await self.wait_until_guild_available()
+
+        try:
+            await self._database_ready
+        except sqlite3.Error:
+            log.exception("Failed to create the database tables")
+
+        log.debug("Guild available, loading %d queued extensions", len(self._pending_extensions))
+        await self.load_extensions(*self._pending_extensions)
+        self._pending_extensions.clear()
+
+    async def load_extensions(self, *names: str) -> None:
+        """
+        Load all of the given extensions, importing them concurrently.
+
+        Importing is the slow part of loading an extension, so all of the modules are first imported
+        in executor threads at once. The extensions are then loaded one by one from the event loop,
+        since their `setup` functions add cogs and schedule tasks, which isn't thread-safe.
+        An extension which fails to import or load is logged and skipped, the rest are still loaded.
+        """
+        imports = await asyncio.gather(
+            *(self.loop.run_in_executor(None, importlib.import_module, name) for name in names),
+            return_exceptions=True
+        )
+
+        for name, result in zip(names, imports):
+            if isinstance(result, BaseException):
+                log.error("Failed to import extension %s", name, exc_info=result)
+                continue
+
+            try:
+                self.load_extension(name)
+            except Exception:
+                log.exception("Failed to load extension %s", name)
 
     def add_cog(self, cog: commands.Cog) -> None:
-        """Adds a "cog" to the bot and logs the operation."""
+        """Adds a "cog" to the bot, logs the operation and dispatches the `cog_add` event."""
         super().add_cog(cog)
         log.info(f"Cog loaded: {cog.qualified_name}")
+        self.dispatch("cog_add", cog)
+
+    def remove_cog(self, name: str) -> None:
+        """Removes a "cog" from the bot and dispatches the `cog_remove` event if it was loaded."""
+        cog = self.get_cog(name)
+        super().remove_cog(name)
+        if cog is not None:
+            log.info(f"Cog unloaded: {cog.qualified_name}")
+            self.dispatch("cog_remove", cog)
 
     def clear(self) -> None:
         """
@@ -33,6 +120,24 @@ class Bot(commands.Bot):
         self._recreate()
         super().clear()
 
+    def _recreate(self) -> None:
+        """Create the aiohttp session shared by the cogs, closing the previous one if it's still open."""
+        if self.http_session is not None and not self.http_session.closed:
+            log.warning("The previous http_session wasn't closed before a new one was created, closing it now")
+            self.loop.create_task(self.http_session.close())
+
+        self.http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300),
+            json_serialize=lambda obj: orjson.dumps(obj).decode(),
+        )
+
+    async def close(self) -> None:
+        """Close the Discord connection and the aiohttp session."""
+        await super().close()
+
+        if self.http_session is not None:
+            await self.http_session.close()
+
     async def on_guild_available(self, guild: discord.Guild) -> None:
         """
         Set the internal guild available event when constants.Guild.id becomes available.
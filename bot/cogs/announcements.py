@@ -1,14 +1,15 @@
 import logging
+import typing as t
 
+from discord import Role
 from discord.ext import commands
 from discord.ext.commands import Context, command
 
 from bot.bot import Bot
 from bot.constants import STAFF_ROLES
 from bot.constants import Bot as BotConstant
-from bot.constants import Channels, Emojis, Roles
+from bot.constants import Channels, Emojis, Guild, Roles
 from bot.decorators import in_whitelist
-from bot.utils.checks import with_role_check, without_role_check
 
 log = logging.getLogger(__name__)
 
@@ -16,17 +17,51 @@ log = logging.getLogger(__name__)
 class Announcements(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        self._role: t.Optional[Role] = None
+        self.bot.loop.create_task(self._get_role())
+
+    async def _get_role(self) -> None:
+        """Cache the announcements role once the guild is available."""
+        await self.bot.wait_until_guild_available()
+        guild = self.bot.get_guild(Guild.id)
+        self._role = guild.get_role(Roles.announcements)
+
+    @commands.Cog.listener()
+    async def on_guild_role_create(self, role: Role) -> None:
+        """Cache the announcements role if it was the one created."""
+        if role.id == Roles.announcements:
+            self._role = role
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: Role) -> None:
+        """Drop the cached announcements role if it was the one deleted."""
+        if role.id == Roles.announcements:
+            self._role = None
+
+    async def _ensure_role(self, ctx: Context) -> t.Optional[Role]:
+        """Get the announcements role, telling the user if it doesn't exist."""
+        if self._role is None:
+            # The startup lookup may not have finished yet
+            self._role = ctx.guild.get_role(Roles.announcements)
+            if self._role is None:
+                log.warning("Announcements role (%s) wasn't found", Roles.announcements)
+                await ctx.send(f"{Emojis.cross_mark}The announcements role doesn't exist, please contact the staff")
+        return self._role
 
     @in_whitelist(redirect=Channels.commands, roles=STAFF_ROLES)
     @command()
     async def subscribe(self, ctx: Context) -> None:
         """Get notified on new announcements"""
-        if without_role_check(ctx, Roles.announcements):
+        if await self._ensure_role(ctx) is None:
+            return
+
+        # `Member.roles` builds and sorts a list of Role objects, `_roles` is a SnowflakeList of the IDs
+        # which supports binary search. This can be replaced with `Member.get_role` on d.py 2.0+
+        if not ctx.author._roles.has(Roles.announcements):
             author = ctx.author
-            role = ctx.guild.get_role(Roles.announcements)
 
-            await author.add_roles(role)
-            log.debug(f"User {author} has subscribed to notifications")
+            await author.add_roles(self._role, reason="Subscribed to announcements")
+            log.debug("User %s has subscribed to notifications", author)
             await ctx.send(f"{Emojis.check_mark}You will now be notified on new announcements {author.mention}")
         else:
             await ctx.send(f"{Emojis.cross_mark}You are already subscribed (use `{BotConstant.prefix}unsubscribe` to unsubscribe)")
@@ -35,12 +70,14 @@ class Announcements(commands.Cog):
     @command()
     async def unsubscribe(self, ctx: Context) -> None:
         """Stop receiving new announcements"""
-        if with_role_check(ctx, Roles.announcements):
+        if await self._ensure_role(ctx) is None:
+            return
+
+        if ctx.author._roles.has(Roles.announcements):
             author = ctx.author
-            role = ctx.guild.get_role(Roles.announcements)
 
-            await author.remove_roles(role)
-            log.debug(f"User {author} has unsubscribed to notifications")
+            await author.remove_roles(self._role, reason="Unsubscribed from announcements")
+            log.debug("User %s has unsubscribed to notifications", author)
             await ctx.send(f"{Emojis.check_mark}You will no longer be notified on new announcements {author.mention}")
         else:
             await ctx.send(f"{Emojis.cross_mark}You are already unsubscribed (use `{BotConstant.prefix}subscribe` to subscribe)")
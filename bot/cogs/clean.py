@@ -1,6 +1,8 @@
+import asyncio
 import logging
-import random
 import re
+from datetime import datetime, timedelta
+from random import choice
 from typing import Optional
 
 from discord import Colour, Embed, Member, Message, TextChannel, User
@@ -14,12 +16,21 @@ from bot.utils.checks import has_higher_role_check, with_role_check
 
 log = logging.getLogger(__name__)
 
+MSG_LIMIT = CleanMessages.message_limit
+SOFT_RED = Colour(Colours.soft_red)
+BULK_ICON = Icons.message_bulk_delete
+MOD_LOG_ID = Channels.mod_log
+MSG_DEL_EVENT = Event.message_delete
+
 
 class Clean(Cog):
     """
     A cog which allows messages to be deleted
     """
 
+    # Template for the error embeds, copied and filled in when sending one
+    error_embed = Embed(colour=SOFT_RED)
+
     def __init__(self, bot):
         self.bot = bot
         self.cleaning = False
@@ -50,35 +61,37 @@ class Clean(Cog):
 
         def predicate_regex(message: Message) -> bool:
             """Check if the regex provided in _clean_messages matches the message content or any embed attributes."""
-            content = [message.content]
+            # Most messages don't have any embeds, there's no need to join anything for those
+            if not message.embeds:
+                return bool(message.content) and bool(compiled_regex.search(message.content))
 
-            # Add the content for all embed attributes
+            # Add the content for all embed attributes, read from a plain dict of every embed
+            # rather than through the EmbedProxy attributes
+            content = [message.content]
             for embed in message.embeds:
-                content.append(embed.title)
-                content.append(embed.description)
-                content.append(embed.footer.text)
-                content.append(embed.author.name)
-                for field in embed.fields:
-                    content.append(field.name)
-                    content.append(field.value)
+                embed_dict = embed.to_dict()
+                content.append(embed_dict.get("title"))
+                content.append(embed_dict.get("description"))
+                content.append(embed_dict.get("footer", {}).get("text"))
+                content.append(embed_dict.get("author", {}).get("name"))
+                for field in embed_dict.get("fields", ()):
+                    content.append(field["name"])
+                    content.append(field["value"])
 
             # Get rid of empty attributes and turn it into a string
-            content = [attr for attr in content if attr]
-            content = "\n".join(content)
+            content = "\n".join(filter(None, content))
 
             # Now let's see if there's a regex match
             if not content:
                 return False
             else:
-                return bool(re.search(regex.lower(), content.lower()))
+                return bool(compiled_regex.search(content))
 
         # Is this an acceptable amount of messages to clean?
-        if amount > CleanMessages.message_limit:
-            embed = Embed(
-                color=Colours.soft_red,
-                title=random.choice(NEGATIVE_REPLIES),
-                description=f"You can clean maximum {CleanMessages.message_limit} messages."
-            )
+        if amount > MSG_LIMIT:
+            embed = self.error_embed.copy()
+            embed.title = choice(NEGATIVE_REPLIES)
+            embed.description = f"You can clean maximum {MSG_LIMIT} messages."
             await ctx.send(embed=embed)
             return
 
@@ -88,21 +101,27 @@ class Clean(Cog):
 
         # Only MODERATION_ROLES can clean other channels
         if channel != ctx.channel and not with_role_check(ctx, *MODERATION_ROLES):
-            embed = Embed(
-                color=Colours.soft_red,
-                title=random.choice(NEGATIVE_REPLIES),
-                description="You can only use clean in the channel where you are"
-            )
+            embed = self.error_embed.copy()
+            embed.title = choice(NEGATIVE_REPLIES)
+            embed.description = "You can only use clean in the channel where you are"
             await ctx.send(embed=embed)
             return
 
         # Are we already performing a clean?
         if self.cleaning:
-            embed = Embed(
-                color=Colour(Colours.soft_red),
-                title=random.choice(NEGATIVE_REPLIES),
-                description="Please wait for the currently ongoing clean operation to complete."
-            )
+            embed = self.error_embed.copy()
+            embed.title = choice(NEGATIVE_REPLIES)
+            embed.description = "Please wait for the currently ongoing clean operation to complete."
+            await ctx.send(embed=embed)
+            return
+
+        # We need the ModLog cog for the whole operation, check it's loaded before deleting anything
+        mod_log = self.mod_log
+        if mod_log is None:
+            log.warning("Unable to clean messages, the ModLog cog isn't loaded")
+            embed = self.error_embed.copy()
+            embed.title = choice(NEGATIVE_REPLIES)
+            embed.description = "Cleaning is currently unavailable, please try again later."
             await ctx.send(embed=embed)
             return
 
@@ -112,6 +131,7 @@ class Clean(Cog):
         elif user:
             predicate = predicate_specific_user  # Delete messages from specific user
         elif regex:
+            compiled_regex = re.compile(regex, re.IGNORECASE)
             predicate = predicate_regex          # Delete messages that match regex
         else:
             predicate = None                     # Delete all messages
@@ -120,45 +140,48 @@ class Clean(Cog):
         messages = []
         message_ids = []
         self.cleaning = True
-        invocation_deleted = False
 
-        # To account for the invocation message, we index `amount + 1` messages.
-        async for message in channel.history(limit=amount + 1):
+        # Always start by deleting the invocation, this is done in the background while the history
+        # is being fetched. Don't send log of this deleted message (it is only the command itself)
+        mod_log.ignore(MSG_DEL_EVENT, ctx.message.id)
+        invocation_deletion = asyncio.create_task(ctx.message.delete())
+
+        # Only look at the messages sent before the invocation, so it isn't counted in `amount`
+        async for message in channel.history(limit=amount, before=ctx.message):
 
             # If at any point the cancel command is invoked, we should stop.
             if not self.cleaning:
+                await invocation_deletion
                 return
 
-            # Always start by deleting the invocation
-            if not invocation_deleted:
-                # Don't send log of this deleted message (it is only the command itself)
-                self.mod_log.ignore(Event.message_delete, message.id)
-                await message.delete()
-                invocation_deleted = True
-                continue
-
             # If the message passes predicate, let's save it.
             if predicate is None or predicate(message):
                 message_ids.append(message.id)
                 messages.append(message)
 
         self.cleaning = False
+        await invocation_deletion
 
         # We should ignore the ID's we stored, so we don't get mod-log spam.
-        self.mod_log.ignore(Event.message_delete, *message_ids)
+        mod_log.ignore(MSG_DEL_EVENT, *message_ids)
+
+        # Use bulk delete to actually do the cleaning. It's far faster, but Discord only allows
+        # bulk deleting up to 100 messages at once, which can't be older than 14 days.
+        bulk_delete_cutoff = datetime.utcnow() - timedelta(days=14)
+        bulk_deletable = []
+        for message in messages:
+            if message.created_at > bulk_delete_cutoff:
+                bulk_deletable.append(message)
+            else:
+                await message.delete()
 
-        # Use bulk delete to actually do the cleaning. It's far faster.
-        await channel.purge(
-            limit=amount,
-            check=predicate
-        )
+        for i in range(0, len(bulk_deletable), 100):
+            await channel.delete_messages(bulk_deletable[i:i + 100])
 
         # Can't build an embed, nothing to clean!
         if not messages:
-            embed = Embed(
-                color=Colour(Colours.soft_red),
-                description="No matching messages could be found."
-            )
+            embed = self.error_embed.copy()
+            embed.description = "No matching messages could be found."
             await ctx.send(embed=embed, delete_after=10)
             return
 
@@ -167,12 +190,12 @@ class Clean(Cog):
             f"**{len(message_ids)}** messages deleted in <#{channel.id}> by **{ctx.author.name}**\n\n"
         )
 
-        await self.mod_log.send_log_message(
-            icon_url=Icons.message_bulk_delete,
-            colour=Colour(Colours.soft_red),
+        await mod_log.send_log_message(
+            icon_url=BULK_ICON,
+            colour=SOFT_RED,
             title="Bulk message delete",
             text=message,
-            channel_id=Channels.mod_log,
+            channel_id=MOD_LOG_ID,
         )
 
     # When no subcommand was found, invoke help
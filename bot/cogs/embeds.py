@@ -1,9 +1,12 @@
+import asyncio
+import contextlib
+import functools
 import logging
-import textwrap
+import time
 import typing as t
-from collections import defaultdict
+from collections import OrderedDict
 
-from discord import Colour, Embed, TextChannel
+from discord import Colour, Embed, Member, Message, TextChannel
 from discord.ext.commands import Cog, ColourConverter, Context, command, group
 
 from bot.bot import Bot
@@ -18,6 +21,46 @@ prefix = BotConstant.prefix
 
 log = logging.getLogger(__name__)
 
+# Maximum amount of embeds which can be built at once, the least recently used one gets dropped
+MAX_EMBED_SESSIONS = 1024
+# Time (in seconds) for which confirmations of embed changes are collected before they're sent as one message
+ACK_DELAY = 0.5
+# Time (in seconds) after which an untouched embed session gets dropped
+EMBED_SESSION_TTL = 6 * 60 * 60
+# How long (in seconds) can the permission to send embeds into a channel be cached for
+SEND_PERMISSION_TTL = 30
+# Maximum amount of cached channel permissions, the least recently used one gets dropped
+MAX_CACHED_PERMISSIONS = 128
+
+# Limits of Discord API on the total amount of characters and on the amount of fields in an embed
+MAX_EMBED_LENGTH = 6000
+MAX_EMBED_FIELDS = 25
+
+# Error messages, only the mention of the author is filled in when sending them
+NO_EMBED_MESSAGE = (
+    f"{Emojis.cross_mark} {{mention}} No active embed found, "
+    f"are you in embed building mode? (`{prefix}help Embeds`)"
+)
+NO_FIELD_MESSAGE = f"{Emojis.cross_mark} {{mention}} Sorry, but there is no such field ID"
+
+# Text of the mod-log entry for every sent embed, filled in with the author and message details
+EMBED_SENT_LOG_TEXT = (
+    "\n"
+    "Actor: {author_mention} (`{author_id}`)\n"
+    "Channel: {channel_mention}\n"
+    "Message jump link: {jump_url}\n"
+)
+
+
+class EmbedSession:
+    """An embed which is being built by a user."""
+
+    __slots__ = ("embed", "last_used")
+
+    def __init__(self):
+        self.embed = Embed()
+        self.last_used = time.monotonic()
+
 
 class Embeds(Cog):
     """
@@ -26,13 +69,36 @@ class Embeds(Cog):
 
     def __init__(self, bot: Bot):
         self.bot = bot
-        self.embeds = {}
-        self.embed_field_id = defaultdict(lambda: -1)
+        self._sessions: t.OrderedDict[int, EmbedSession] = OrderedDict()
+        self._mod_log: t.Optional[ModLog] = None
+        # Messages which are still being sent, kept referenced so they don't get garbage collected
+        self._background_tasks: t.Set[asyncio.Task] = set()
+        # (author ID, channel ID) -> (confirmations which weren't sent yet, timer sending them as a single message)
+        self._pending_acks: t.Dict[t.Tuple[int, int], t.Tuple[t.List[str], asyncio.TimerHandle]] = {}
+        # (author ID, channel ID) -> latest batch of confirmations being sent after their timer ran out,
+        # every batch waits for the one queued before it
+        self._sending_acks: t.Dict[t.Tuple[int, int], asyncio.Task] = {}
+        # (channel ID, author ID) -> (expiry time, whether the author can send messages to the channel)
+        self._send_permissions: t.OrderedDict[t.Tuple[int, int], t.Tuple[float, bool]] = OrderedDict()
 
     @property
-    def mod_log(self) -> ModLog:
-        """Get currently loaded ModLog cog instance."""
-        return self.bot.get_cog("ModLog")
+    def mod_log(self) -> t.Optional[ModLog]:
+        """Get currently loaded ModLog cog instance, cached until the cog gets added or removed."""
+        if self._mod_log is None:
+            self._mod_log = self.bot.get_cog("ModLog")
+        return self._mod_log
+
+    @Cog.listener()
+    async def on_cog_add(self, cog: Cog) -> None:
+        """Cache the ModLog cog once it gets loaded."""
+        if cog.qualified_name == "ModLog":
+            self._mod_log = cog
+
+    @Cog.listener()
+    async def on_cog_remove(self, cog: Cog) -> None:
+        """Forget the cached ModLog cog once it gets unloaded."""
+        if cog is self._mod_log:
+            self._mod_log = None
 
     # region: embed mode
 
@@ -40,57 +106,68 @@ class Embeds(Cog):
     @with_role(*MODERATION_ROLES)
     async def embedbuild(self, ctx: Context) -> None:
         """Enter embed creation mode"""
-        if ctx.author not in self.embeds:
-            await ctx.send(f"{ctx.author.mention} You are now in embed creation mode, use `{prefix}help Embed` for more info")
-            self.embeds[ctx.author] = Embed()
+        self._drop_expired_sessions()
+        if ctx.author.id not in self._sessions:
+            await self._reply(ctx, f"{ctx.author.mention} You are now in embed creation mode, use `{prefix}help Embed` for more info")
+            self._start_session(ctx.author.id)
         else:
-            await ctx.send(f"{Emojis.cross_mark} {ctx.author.mention} You are already in embed creation mode, use `{prefix}help Embed` for more info")
+            await self._reply(
+                ctx,
+                f"{Emojis.cross_mark} {ctx.author.mention} You are already in embed creation mode, use `{prefix}help Embed` for more info"
+            )
 
     @command()
     @with_role(*MODERATION_ROLES)
     async def embedquit(self, ctx: Context) -> None:
         """Leave embed creation mode"""
-        if ctx.author in self.embeds:
-            await ctx.send(f"{ctx.author.mention} You are no longer in embed creation mode, your embed was cleared")
-            del self.embeds[ctx.author]
+        if ctx.author.id in self._sessions:
+            await self._reply(ctx, f"{ctx.author.mention} You are no longer in embed creation mode, your embed was cleared")
+            self._drop_session(ctx.author.id)
         else:
-            await ctx.send(f"{Emojis.cross_mark} {ctx.author.mention} You aren't in embed mode")
+            await self._reply(ctx, f"{Emojis.cross_mark} {ctx.author.mention} You aren't in embed mode")
 
     @command()
     @with_role(*MODERATION_ROLES)
     async def embedshow(self, ctx: Context) -> None:
         """Take a look at the embed"""
-        if not await self.has_active_embed(ctx):
+        embed = await self._get_or_warn(ctx)
+        if embed is None or not await self._check_size(ctx, embed):
             return
 
-        await ctx.send(embed=self.embeds[ctx.author])
+        await self._reply(ctx, embed=embed)
 
     @command()
     @with_role(*MODERATION_ROLES)
     async def embedsend(self, ctx: Context, channel: TextChannel) -> None:
         """Send the Embed to specified channel"""
-        if not await self.has_active_embed(ctx):
+        embed = await self._get_or_warn(ctx)
+        if embed is None or not await self._check_size(ctx, embed):
             return
 
-        channel_perms = channel.permissions_for(ctx.author)
-        if channel_perms.send_messages:
-            embed_msg = await channel.send(embed=self.embeds[ctx.author])
-
-            await self.mod_log.send_log_message(
-                icon_url=Icons.message_edit,
-                colour=Colour.blurple(),
-                title="Embed message sent",
-                thumbnail=ctx.author.avatar_url_as(static_format="png"),
-                text=textwrap.dedent(f"""
-                    Actor: {ctx.author.mention} (`{ctx.author.id}`)
-                    Channel: {channel.mention}
-                    Message jump link: {embed_msg.jump_url}
-                """),
-            )
+        if self._can_send(channel, ctx.author):
+            embed_msg = await channel.send(embed=embed)
+
+            mod_log = self.mod_log
+            if mod_log is None:
+                log.warning(f"Unable to log embed sent by {ctx.author} to #{channel}, the ModLog cog isn't loaded")
+            else:
+                # Don't make the author wait for the log, it's sent in the background
+                self._run_in_background(mod_log.send_log_message(
+                    icon_url=Icons.message_edit,
+                    colour=Colour.blurple(),
+                    title="Embed message sent",
+                    thumbnail=ctx.author.avatar_url_as(static_format="png"),
+                    text=EMBED_SENT_LOG_TEXT.format(
+                        author_mention=ctx.author.mention,
+                        author_id=ctx.author.id,
+                        channel_mention=channel.mention,
+                        jump_url=embed_msg.jump_url,
+                    ),
+                ))
             log.info(f"User {ctx.author} sent embed message to #{channel}")
-            await ctx.send(f"{Emojis.check_mark} Embed sent")
+            await self._reply(ctx, f"{Emojis.check_mark} Embed sent")
         else:
-            await ctx.send(f"{Emojis.cross_mark} {ctx.author.mention} Sorry but you don't have permission to send messages to this channel")
+            await self._reply(ctx, f"{Emojis.cross_mark} {ctx.author.mention} Sorry but you don't have permission to send messages to this channel")
 
     # endregion
     # region: embed build
@@ -98,88 +175,94 @@ class Embeds(Cog):
     @with_role(*MODERATION_ROLES)
     async def embed_group(self, ctx: Context) -> None:
         """Commands for configuring the Embed message"""
+        await self._flush_acks(ctx)
         await ctx.send_help(ctx.command)
 
     @embed_group.command(name="title")
     @with_role(*MODERATION_ROLES)
     async def embed_title(self, ctx: Context, *, title: str) -> None:
         """Set embeds title"""
-        if not await self.has_active_embed(ctx):
+        embed = await self._get_or_warn(ctx)
+        if embed is None:
             return
 
-        self.embeds[ctx.author].title = title
-        await ctx.send("Embeds title updated")
+        embed.title = title
+        self._ack(ctx, "Embeds title updated")
 
     @embed_group.command(name="description")
     @with_role(*MODERATION_ROLES)
     async def embed_description(self, ctx: Context, *, description: str) -> None:
         """Set embeds title"""
-        if not await self.has_active_embed(ctx):
+        embed = await self._get_or_warn(ctx)
+        if embed is None:
             return
 
-        self.embeds[ctx.author].description = description
-        await ctx.send("Embeds description updated")
+        embed.description = description
+        self._ack(ctx, "Embeds description updated")
 
     @embed_group.command(name="footer")
     @with_role(*MODERATION_ROLES)
     async def embed_footer(self, ctx: Context, *, footer: str) -> None:
         """Set embeds footer"""
-        if not await self.has_active_embed(ctx):
+        embed = await self._get_or_warn(ctx)
+        if embed is None:
             return
 
-        self.embeds[ctx.author].set_footer(text=footer)
-        await ctx.send("Embeds footer updated")
+        embed.set_footer(text=footer)
+        self._ack(ctx, "Embeds footer updated")
 
     @embed_group.command(name="image", aliases=["img"])
     @with_role(*MODERATION_ROLES)
     async def embed_image(self, ctx: Context, *, url: str) -> None:
         """Set embeds image"""
-        if not await self.has_active_embed(ctx):
+        embed = await self._get_or_warn(ctx)
+        if embed is None:
             return
 
-        self.embeds[ctx.author].set_image(url=url)
-        await ctx.send("Embeds Image URL updated")
+        embed.set_image(url=url)
+        self._ack(ctx, "Embeds Image URL updated")
 
     @embed_group.command(name="color", aliases=["colour"])
     @with_role(*MODERATION_ROLES)
     async def embed_color(self, ctx: Context, *, color: ColourConverter) -> None:
         """Set embeds title, `color` can be HEX color or some of standard colors (red, blue, ...)"""
-        if not await self.has_active_embed(ctx):
+        embed = await self._get_or_warn(ctx)
+        if embed is None:
             return
 
-        self.embeds[ctx.author].colour = color
-        await ctx.send("Embeds color updated")
+        embed.colour = color
+        self._ack(ctx, "Embeds color updated")
 
     # region: author
     @embed_group.command(name="author", aliases=["setauthor", "authorname"])
     @with_role(*MODERATION_ROLES)
     async def embed_author_name(self, ctx: Context, *, author_name: str) -> None:
         """Set authors name in embed"""
-        if not await self.has_active_embed(ctx):
+        embed = await self._get_or_warn(ctx)
+        if embed is None:
             return
 
-        embed = self.embeds[ctx.author]
         embed.set_author(
             name=author_name,
             url=embed.author.url,
             icon_url=embed.author.icon_url
         )
-        await ctx.send("Embeds author updated")
+        self._ack(ctx, "Embeds author updated")
 
     @embed_group.command(name="authorurl", aliases=["setauthorurl"])
     @with_role(*MODERATION_ROLES)
     async def embed_author_url(self, ctx: Context, *, author_url: str) -> None:
         """Set authors URL in embed"""
-        if not await self.has_active_embed(ctx):
+        embed = await self._get_or_warn(ctx)
+        if embed is None:
             return
 
-        embed = self.embeds[ctx.author]
         embed.set_author(
             name=embed.author.name,
             url=author_url,
             icon_url=embed.author.icon_url
         )
-        await ctx.send("Embeds author URL updated")
+        self._ack(ctx, "Embeds author URL updated")
 
     @embed_group.command(name="authoricon", aliases=[
         "setauthoricon", "authoriconurl", "setauthoriconurl"
@@ -187,18 +270,18 @@ class Embeds(Cog):
     @with_role(*MODERATION_ROLES)
     async def embed_author_icon(self, ctx: Context, *, icon_url: t.Union[FetchedMember, str]) -> None:
         """Set authors icon in embed (You can also mention user to get his avatar)"""
-        if not await self.has_active_embed(ctx):
+        embed = await self._get_or_warn(ctx)
+        if embed is None:
             return
 
-        embed = self.embeds[ctx.author]
-        if type(icon_url) != str:
+        if not isinstance(icon_url, str):
             icon_url = icon_url.avatar_url_as(format="png")
         embed.set_author(
             name=embed.author.name,
             url=embed.author.url,
             icon_url=icon_url
         )
-        await ctx.send("Embeds authors image updated")
+        self._ack(ctx, "Embeds authors image updated")
 
     # endregion
 
@@ -210,68 +293,30 @@ class Embeds(Cog):
     @with_role(*MODERATION_ROLES)
     async def embed_field_create(self, ctx: Context, *, title: str = "None") -> None:
         """Create new field in embed"""
-        if not await self.has_active_embed(ctx):
+        embed = await self._get_or_warn(ctx)
+        if embed is None:
             return
 
-        self.embeds[ctx.author].add_field(name=title, value="None")
-        self.embed_field_id[ctx.author] += 1
-        await ctx.send(f"Embed field with ID **{self.embed_field_id[ctx.author]}** created")
+        embed.add_field(name=title, value="None")
+        self._ack(ctx, f"Embed field with ID **{len(embed.fields) - 1}** created")
 
     @embed_group.command(name="fielddescription", aliases=["fieldvalue"])
     @with_role(*MODERATION_ROLES)
     async def embed_field_description(self, ctx: Context, ID: int, *, description: str) -> None:
         """Set description of embeds field"""
-        if not await self.has_active_embed(ctx):
-            return
-        if self.embed_field_id[ctx.author] < ID or ID < 0:
-            await ctx.send(f"{Emojis.cross_mark} {ctx.author.mention} Sorry, but there is no such field ID")
-            return
-
-        embed = self.embeds[ctx.author]
-        embed.set_field_at(
-            ID,
-            name=embed.fields[ID].name,
-            value=description
-        )
-        await ctx.send(f"Embed field with ID: **{ID}** updated")
+        await self._edit_field(ctx, ID, value=description)
 
     @embed_group.command(name="fieldtitle", aliases=["fieldname"])
     @with_role(*MODERATION_ROLES)
     async def embed_field_title(self, ctx: Context, ID: int, *, title: str) -> None:
         """Set title of embeds field"""
-        if not await self.has_active_embed(ctx):
-            return
-        if self.embed_field_id[ctx.author] < ID or ID < 0:
-            await ctx.send(f"{Emojis.cross_mark} {ctx.author.mention} Sorry, but there is no such field ID")
-            return
-
-        embed = self.embeds[ctx.author]
-        embed.set_field_at(
-            ID,
-            name=title,
-            value=embed.fields[ID].value
-        )
-        await ctx.send(f"Embed field with ID: **{ID}** updated")
+        await self._edit_field(ctx, ID, name=title)
 
     @embed_group.command(name="fieldinline")
     @with_role(*MODERATION_ROLES)
     async def embed_field_inline(self, ctx: Context, ID: int, inline: bool) -> None:
         """Choose if embed should be inline or not"""
-        if not await self.has_active_embed(ctx):
-            return
-
-        if self.embed_field_id[ctx.author] < ID or ID < 0:
-            await ctx.send(f"{Emojis.cross_mark} {ctx.author.mention} Sorry, but there is no such field ID")
-            return
-
-        embed = self.embeds[ctx.author]
-        embed.set_field_at(
-            ID,
-            name=embed.fields[ID].name,
-            value=embed.fields[ID].value,
-            inline=inline
-        )
-        await ctx.send(f"Embed field with ID: **{ID}** updated")
+        await self._edit_field(ctx, ID, inline=inline)
 
     @embed_group.command(name="removefield", aliases=[
         "deletefield", "fieldremove", "fieldrem",
@@ -280,29 +325,200 @@ class Embeds(Cog):
     @with_role(*MODERATION_ROLES)
     async def embed_field_remove(self, ctx: Context, ID: int) -> None:
         """Remove field in embed"""
-        if not await self.has_active_embed(ctx):
+        embed = await self._get_or_warn(ctx)
+        if embed is None:
             return
 
-        if self.embed_field_id[ctx.author] < ID or ID < 0:
-            await ctx.send(f"{Emojis.cross_mark} {ctx.author.mention} Sorry, but there is no such field ID")
+        if not 0 <= ID < len(embed.fields):
+            await self._reply(ctx, NO_FIELD_MESSAGE.format(mention=ctx.author.mention))
             return
 
-        self.embeds[ctx.author].remove_field(ID)
-        self.embed_field_id[ctx.author] -= 1
-        await ctx.send(f"Embed field with ID: **{ID}** removed (all other IDs were renumbered accordingly)")
+        embed.remove_field(ID)
+        self._ack(ctx, f"Embed field with ID: **{ID}** removed (all other IDs were renumbered accordingly)")
     # endregion
     # endregion
 
-    async def has_active_embed(self, ctx):
-        if ctx.author in self.embeds:
-            return True
-        else:
-            await ctx.send(
-                f"{Emojis.cross_mark} {ctx.author.mention} No active embed found, "
-                f"are you in embed building mode? (`{BotConstant.prefix}help Embeds`)"
+    def _start_session(self, author_id: int) -> None:
+        """Start a new embed session, dropping the least recently used one if there's too many."""
+        self._sessions[author_id] = EmbedSession()
+
+        if len(self._sessions) > MAX_EMBED_SESSIONS:
+            dropped_id = next(iter(self._sessions))
+            self._drop_session(dropped_id)
+            log.debug(f"Dropped the least recently used embed session of {dropped_id}")
+
+    def _drop_expired_sessions(self) -> None:
+        """Drop all embed sessions which weren't used for longer than `EMBED_SESSION_TTL`."""
+        expiry = time.monotonic() - EMBED_SESSION_TTL
+        # Sessions are ordered by their last use, so the expired ones are always at the start
+        while self._sessions:
+            author_id, session = next(iter(self._sessions.items()))
+            if session.last_used > expiry:
+                break
+            self._drop_session(author_id)
+            log.debug(f"Dropped the expired embed session of {author_id}")
+
+    def _drop_session(self, author_id: int) -> None:
+        """Forget the embed session of given author."""
+        del self._sessions[author_id]
+
+    async def _check_size(self, ctx: Context, embed: Embed) -> bool:
+        """Check that Discord will accept the embed, let the author know what's wrong if it won't."""
+        # `len(embed)` is the total amount of characters, counted the same way Discord counts them
+        embed_length = len(embed)
+        if embed_length > MAX_EMBED_LENGTH:
+            await self._reply(
+                ctx,
+                f"{Emojis.cross_mark} {ctx.author.mention} Embed is too large "
+                f"({embed_length}/{MAX_EMBED_LENGTH} characters)"
+            )
+            return False
+
+        field_count = len(embed.fields)
+        if field_count > MAX_EMBED_FIELDS:
+            await self._reply(
+                ctx,
+                f"{Emojis.cross_mark} {ctx.author.mention} Embed has too many fields "
+                f"({field_count}/{MAX_EMBED_FIELDS})"
             )
             return False
 
+        return True
+
+    async def _edit_field(self, ctx: Context, ID: int, **changes: t.Any) -> None:
+        """Apply `changes` to field `ID` of the authors embed, keeping all other field attributes."""
+        embed = await self._get_or_warn(ctx)
+        if embed is None:
+            return
+
+        fields = embed.fields
+        if not 0 <= ID < len(fields):
+            await self._reply(ctx, NO_FIELD_MESSAGE.format(mention=ctx.author.mention))
+            return
+
+        embed_field = fields[ID]
+        embed.set_field_at(
+            ID,
+            name=changes.get("name", embed_field.name),
+            value=changes.get("value", embed_field.value),
+            inline=changes.get("inline", embed_field.inline)
+        )
+        self._ack(ctx, f"Embed field with ID: **{ID}** updated")
+
+    def _can_send(self, channel: TextChannel, member: Member) -> bool:
+        """Check if `member` can send messages to `channel`, caching the result for a while."""
+        key = (channel.id, member.id)
+        now = time.monotonic()
+
+        cached = self._send_permissions.get(key)
+        if cached is not None and cached[0] > now:
+            self._send_permissions.move_to_end(key)
+            return cached[1]
+
+        can_send = channel.permissions_for(member).send_messages
+        self._send_permissions[key] = (now + SEND_PERMISSION_TTL, can_send)
+        self._send_permissions.move_to_end(key)
+        if len(self._send_permissions) > MAX_CACHED_PERMISSIONS:
+            self._send_permissions.popitem(last=False)
+        return can_send
+
+    def _ack(self, ctx: Context, text: str) -> None:
+        """
+        Confirm an embed change to the author.
+
+        Confirmations made in the same channel within `ACK_DELAY` seconds of each other are merged
+        into a single message, so that building an embed with many quick commands doesn't spam the channel.
+        """
+        key = (ctx.author.id, ctx.channel.id)
+        pending = self._pending_acks.get(key)
+        if pending is not None:
+            pending[0].append(text)
+            return
+
+        timer = self.bot.loop.call_later(ACK_DELAY, self._send_acks_later, ctx)
+        self._pending_acks[key] = ([text], timer)
+
+    def _pop_acks(self, ctx: Context) -> t.Optional[str]:
+        """Take the pending confirmations of the author in the channel of `ctx`, merged into one message."""
+        pending = self._pending_acks.pop((ctx.author.id, ctx.channel.id), None)
+        if pending is None:
+            return None
+
+        texts, timer = pending
+        timer.cancel()
+        return "\n".join(texts)
+
+    def _send_acks_later(self, ctx: Context) -> None:
+        """Send the pending confirmations of the author once `ACK_DELAY` runs out."""
+        acks = self._pop_acks(ctx)
+        if acks is None:
+            return
+
+        key = (ctx.author.id, ctx.channel.id)
+        task = self._run_in_background(self._send_acks_after(self._sending_acks.get(key), ctx, acks))
+        self._sending_acks[key] = task
+        task.add_done_callback(functools.partial(self._sending_acks_done, key))
+
+    async def _send_acks_after(self, previous: t.Optional[asyncio.Task], ctx: Context, acks: str) -> None:
+        """Send `acks` once the confirmations which are already being sent are done, keeping them in order."""
+        if previous is not None:
+            # Failures are logged by the background task callback
+            await asyncio.wait((previous,))
+        await ctx.send(acks)
+
+    def _sending_acks_done(self, key: t.Tuple[int, int], task: asyncio.Task) -> None:
+        """Stop tracking the sent confirmations, unless a newer batch is already queued after them."""
+        if self._sending_acks.get(key) is task:
+            del self._sending_acks[key]
+
+    async def _flush_acks(self, ctx: Context) -> None:
+        """Send the pending confirmations of the author right away, waiting until they're sent."""
+        sending = self._sending_acks.get((ctx.author.id, ctx.channel.id))
+        if sending is not None:
+            # Failures are logged by the background task callback
+            await asyncio.wait((sending,))
+
+        acks = self._pop_acks(ctx)
+        if acks is not None:
+            await ctx.send(acks)
+
+    async def _reply(self, ctx: Context, content: t.Optional[str] = None, **kwargs) -> Message:
+        """Reply to the author, after their pending confirmations so that the messages stay in order."""
+        await self._flush_acks(ctx)
+        return await ctx.send(content, **kwargs)
+
+    async def cog_command_error(self, ctx: Context, error: Exception) -> None:
+        """Send the pending confirmations before the error handler replies with the error."""
+        await self._flush_acks(ctx)
+
+    def _run_in_background(self, coro: t.Awaitable) -> asyncio.Task:
+        """Run `coro` as a task, without waiting for it to finish."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_task_done_callback)
+        return task
+
+    def _background_task_done_callback(self, done_task: asyncio.Task) -> None:
+        """Stop tracking a finished background task and log its exception if one exists."""
+        self._background_tasks.discard(done_task)
+
+        with contextlib.suppress(asyncio.CancelledError):
+            exception = done_task.exception()
+            if exception:
+                log.error("Error in a background task of the Embeds cog", exc_info=exception)
+
+    async def _get_or_warn(self, ctx: Context) -> t.Optional[Embed]:
+        """Get the embed the author is building, let them know if they aren't building any."""
+        session = self._sessions.get(ctx.author.id)
+        if session is None:
+            await self._reply(ctx, NO_EMBED_MESSAGE.format(mention=ctx.author.mention))
+            return None
+
+        self._sessions.move_to_end(ctx.author.id)
+        session.last_used = time.monotonic()
+        # Commands mutate this embed in place, there's no need to store it back into the session
+        return session.embed
+
 
 def setup(bot: Bot) -> None:
     """Load the Embeds cog."""
@@ -1,5 +1,7 @@
 import logging
+import time
 import typing as t
+from collections import OrderedDict
 
 from discord.ext.commands import Cog, Context, errors
 from sentry_sdk import push_scope
@@ -9,6 +11,25 @@ from bot.decorators import InWhitelistCheckFailure, PermissionCheckFailure
 
 log = logging.getLogger(__name__)
 
+# Time (in seconds) for which repeated unexpected errors of the same type in the same command aren't sent to Sentry
+ERROR_REPORT_COOLDOWN = 60
+
+# Check failures caused by the bot missing permissions or roles
+BOT_MISSING_ERRORS = (
+    errors.BotMissingPermissions,
+    errors.BotMissingRole,
+    errors.BotMissingAnyRole
+)
+
+# Check failures caused by the user, their message is sent to them
+USER_CHECK_ERRORS = (
+    InWhitelistCheckFailure,
+    PermissionCheckFailure,
+    errors.NoPrivateMessage
+)
+
+ErrorHandlerFunc = t.Callable[[Context, Exception], t.Awaitable[None]]
+
 
 class ErrorHandler(Cog):
     """Handles errors emitted from commands."""
@@ -16,6 +37,19 @@ class ErrorHandler(Cog):
     def __init__(self, bot: Bot):
         self.bot = bot
 
+        # Handler of each error type, looked up through the MRO of the raised error, most specific type first.
+        # Errors without a handler of any of their types are unexpected, errors with a None handler are ignored.
+        self._error_handlers: t.Dict[t.Type[Exception], t.Optional[ErrorHandlerFunc]] = {
+            errors.CommandNotFound: self.handle_command_not_found,
+            errors.UserInputError: self.handle_user_input_error,
+            errors.CheckFailure: self.handle_check_failure,
+            errors.CommandOnCooldown: self.handle_cooldown,
+            errors.CommandInvokeError: self.handle_invoke_error,
+            errors.DisabledCommand: None,
+        }
+        # (command name, error type name) -> time when the error was last reported to Sentry
+        self._reported_errors: t.OrderedDict[t.Tuple[t.Optional[str], str], float] = OrderedDict()
+
     @Cog.listener()
     async def on_command_error(self, ctx: Context, e: errors.CommandError) -> None:
         """
@@ -36,43 +70,44 @@ class ErrorHandler(Cog):
         4. CommandOnCooldown: send an error message in the invoking context
         5. Otherwise, if not a DisabledCommand, handling is deferred to `handle_unexpected_error`
         """
-        command = ctx.command
-
         if hasattr(e, "handled"):
-            log.debug(
-                f"Command {command} had its error already handled locally; ignoring.")
+            log.debug("Command %s had its error already handled locally; ignoring.", ctx.command)
             return
 
-        if isinstance(e, errors.CommandNotFound) and not hasattr(ctx, "invoked_from_error_handler"):
-            await self.command_not_found(ctx)
-            return  # Exit early to avoid logging.
-        elif isinstance(e, errors.UserInputError):
-            await self.handle_user_input_error(ctx, e)
-        elif isinstance(e, errors.CheckFailure):
-            await self.handle_check_failure(ctx, e)
-        elif isinstance(e, errors.CommandOnCooldown):
-            await ctx.send(e)
-        elif isinstance(e, errors.CommandInvokeError):
-            await self.handle_unexpected_error(ctx, e.original)
-            return  # Exit early to avoid logging.
-        elif not isinstance(e, errors.DisabledCommand):
+        for error_type in type(e).__mro__:
+            if error_type in self._error_handlers:
+                handler = self._error_handlers[error_type]
+                break
+        else:
             # ConversionError, MaxConcurrencyReached, ExtensionError
+            handler = self.handle_unexpected_error
+
+        if handler is not None:
+            await handler(ctx, e)
+
+    async def handle_command_not_found(self, ctx: Context, e: errors.CommandNotFound) -> None:
+        """Send an error message in `ctx` for CommandNotFound, it's unexpected when invoked from the error handler."""
+        if hasattr(ctx, "invoked_from_error_handler"):
             await self.handle_unexpected_error(ctx, e)
-            return  # Exit early to avoid logging.
+        else:
+            await self.command_not_found(ctx)
 
-        log.debug(
-            f"Command {command} invoked by {ctx.message.author} with error "
-            f"{e.__class__.__name__}: {e}"
-        )
+    @staticmethod
+    async def handle_cooldown(ctx: Context, e: errors.CommandOnCooldown) -> None:
+        """Send the cooldown error message in `ctx`."""
+        log.debug("Command %s invoked by %s is on cooldown: %s", ctx.command, ctx.author, e)
+        await ctx.send(e)
+
+    async def handle_invoke_error(self, ctx: Context, e: errors.CommandInvokeError) -> None:
+        """Handle the original error raised by the command as an unexpected error."""
+        await self.handle_unexpected_error(ctx, e.original)
 
     @staticmethod
     async def command_not_found(ctx: Context) -> None:
         """
         Send an error message in 'ctx' for CommandNotFound error
         """
-        log.debug(
-            f"{ctx.author} tried to use an invalid command ({ctx.message.content})"
-        )
+        log.debug("%s tried to use an invalid command (%s)", ctx.author, ctx.message.content)
         await ctx.send("Command not found, use !help for help")
 
     @staticmethod
@@ -94,24 +129,22 @@ class ErrorHandler(Cog):
         * ArgumentParsingError: send an error message
         * Other: send an error message and the help command
         """
-        help_command = self.get_help_command(ctx)
-
         if isinstance(e, errors.MissingRequiredArgument):
             await ctx.send(f"Missing required argument `{e.param.name}`.")
-            await help_command
+            await self.get_help_command(ctx)
         elif isinstance(e, errors.TooManyArguments):
             await ctx.send("Too many arguments provided.")
-            await help_command
+            await self.get_help_command(ctx)
         elif isinstance(e, (errors.BadArgument, errors.BadUnionArgument)):
             await ctx.send(f"Bad argument: {e}\n")
-            await help_command
+            await self.get_help_command(ctx)
         elif isinstance(e, errors.BadUnionArgument):
             await ctx.send(f"Bad argument: {e}\n```{e.errors[-1]}```")
         elif isinstance(e, errors.ArgumentParsingError):
             await ctx.send(f"Argument parsing error: {e}")
         else:
             await ctx.send("Something about your input seems off. Check the arguments:")
-            await help_command
+            await self.get_help_command(ctx)
 
     @staticmethod
     async def handle_check_failure(ctx: Context, e: errors.CheckFailure) -> None:
@@ -127,51 +160,79 @@ class ErrorHandler(Cog):
         * InWhitelistCheckFailure
         * PermissionCheckFailure
         """
-        bot_missing_errors = (
-            errors.BotMissingPermissions,
-            errors.BotMissingRole,
-            errors.BotMissingAnyRole
-        )
-
-        user_errors = (
-            InWhitelistCheckFailure,
-            PermissionCheckFailure,
-            errors.NoPrivateMessage
+        log.debug(
+            "Command %s invoked by %s failed a check with %s: %s",
+            ctx.command, ctx.author, e.__class__.__name__, e
         )
 
-        if isinstance(e, bot_missing_errors):
+        if isinstance(e, BOT_MISSING_ERRORS):
             await ctx.send("Sorry, it looks like I don't have the permissions or roles I need to do that.")
-        elif isinstance(e, user_errors):
+        elif isinstance(e, USER_CHECK_ERRORS):
             await ctx.send(e)
 
-    @staticmethod
-    async def handle_unexpected_error(ctx: Context, e: errors.CommandError) -> None:
-        """Send a generic error message in `ctx` and log the exception as an error with exc_info."""
+    def _should_report(self, ctx: Context, e: Exception) -> bool:
+        """Check if the error wasn't already reported to Sentry within the last `ERROR_REPORT_COOLDOWN` seconds."""
+        now = time.monotonic()
+
+        # Forget the errors reported before the cooldown, they're ordered by the time they were reported
+        while self._reported_errors:
+            oldest_key, reported_at = next(iter(self._reported_errors.items()))
+            if reported_at + ERROR_REPORT_COOLDOWN > now:
+                break
+            del self._reported_errors[oldest_key]
+
+        key = (ctx.command.qualified_name if ctx.command else None, e.__class__.__name__)
+        if key in self._reported_errors:
+            return False
+
+        self._reported_errors[key] = now
+        return True
+
+    async def handle_unexpected_error(self, ctx: Context, e: errors.CommandError) -> None:
+        """
+        Send a generic error message in `ctx` and log the exception as an error with exc_info.
+
+        The same error raised repeatedly by the same command is only sent to Sentry once per
+        `ERROR_REPORT_COOLDOWN` seconds, the repeated occurrences are logged as warnings.
+        """
         await ctx.send(
             f"Sorry, an unexpected error occurred. Please let us know!\n\n"
             f"```{e.__class__.__name__}: {e}```"
         )
 
+        if not self._should_report(ctx, e):
+            log.warning(
+                "Error executing command invoked by %s: %s (%s: %s), "
+                "not reporting it as it was already reported recently",
+                ctx.message.author, ctx.message.content, e.__class__.__name__, e
+            )
+            return
+
+        # The error is reported to Sentry through the logging integration, don't build the scope for nothing
+        if not log.isEnabledFor(logging.ERROR):
+            return
+
         with push_scope() as scope:
             scope.user = {
                 "id": ctx.author.id,
                 "username": str(ctx.author)
             }
 
-            scope.set_tag("command", ctx.command.qualified_name)
-            scope.set_tag("message_id", ctx.message.id)
-            scope.set_tag("channel_id", ctx.channel.id)
+            tags = {
+                "command": ctx.command.qualified_name if ctx.command else None,
+                "message_id": ctx.message.id,
+                "channel_id": ctx.channel.id,
+            }
+            for key, value in tags.items():
+                scope.set_tag(key, value)
 
             scope.set_extra("full_message", ctx.message.content)
 
             if ctx.guild is not None:
-                scope.set_extra(
-                    "jump_to",
-                    f"https://discordapp.com/channels/{ctx.guild.id}/{ctx.channel.id}/{ctx.message.id}"
-                )
+                scope.set_extra("jump_to", ctx.message.jump_url)
 
             log.error(
-                f"Error executing command invoked by {ctx.message.author}: {ctx.message.content}", exc_info=e)
+                "Error executing command invoked by %s: %s", ctx.message.author, ctx.message.content, exc_info=e)
 
 
 def setup(bot: Bot) -> None:
@@ -1,26 +1,48 @@
-import re
-from random import randint, choice
-
-from discord import Color, Embed
+import asyncio
+import logging
+import time
+import typing as t
+from random import choice, choices
+
+import orjson
+from aiohttp import ClientError, ClientResponse, ClientResponseError, ClientTimeout
+from discord import Colour, Embed
 from discord.ext.commands import Cog, Context, command
 
-import aiohttp
-
 from bot import constants
 from bot.bot import Bot
 from bot.converters import DiceThrow
 
+log = logging.getLogger(__name__)
+
+# Static part of every dice roll embed, only the roll results and the colour get filled in
+ROLL_EMBED_TEMPLATE = {"type": "rich", "title": "Dice Roll"}
+ROLL_BLURPLE = Colour.blurple().value
+
+# Sent with requests to APIs which reject requests without a user agent
+USER_AGENT = {"User-Agent": "CommandBot"}
+
+# Don't let a slow API keep the command (and the typing indicator) running forever
+HTTP_TIMEOUT = ClientTimeout(total=10)
+# Errors raised when an API can't be reached, responds with an error or doesn't respond in time
+HTTP_ERRORS = (ClientError, asyncio.TimeoutError)
+
+CAT_FACTS_URL = "https://cat-fact.herokuapp.com/facts"
+# The list of cat facts rarely changes, it's only downloaded again after this many seconds
+CAT_FACTS_TTL = 60 * 60
+
 
 class Fun(Cog):
     """
     A cog for built solely for fun
     """
 
-    roll_pattern = re.compile(r"[1-9]*d[1-9]+")
-
     def __init__(self, bot) -> None:
         self.bot = bot
-        self.session = aiohttp.ClientSession()
+        self._cat_facts: t.Optional[t.List[str]] = None
+        self._cat_facts_expiry = 0.0
+        self._cat_facts_lock = asyncio.Lock()
+        self.bot.loop.create_task(self._prefetch_cat_facts())
 
     @command(name="roll", aliases=["dice", "throw", "dicethrow"])
     async def roll(self, ctx: Context, roll_string: DiceThrow) -> None:
@@ -31,86 +53,89 @@ class Fun(Cog):
         throws = roll_string[0]
         sides = roll_string[1]
 
-        rolls = [randint(1, sides) for _ in range(throws)]
+        rolls = choices(range(1, sides + 1), k=throws)
         total = sum(rolls)
 
         # Change color and extra in case there is a natural roll
         # If natural 1 red 20 green, otherwise use blurple
-        color = Color.blurple()
+        color = ROLL_BLURPLE
         extra = " "
-        if all(throw == rolls[0] for throw in rolls):  # All rolls are same
-            if rolls[0] == 1:
-                extra = "natural "
-                color = constants.Colours.soft_red
-            elif rolls[0] == sides:
-                extra = "natural "
-                color = constants.Colours.soft_green
-
-        embed = Embed(
-            title="Dice Roll",
-            description=f"{ctx.author.mention} You have rolled {extra}{total}",
-            color=color
-        )
-        embed.set_footer(text=", ".join(str(roll) for roll in rolls))
+        # All rolls are natural 1s if even the highest one is 1, and natural maximums if even the lowest one is
+        if max(rolls) == 1:
+            extra = "natural "
+            color = constants.Colours.soft_red
+        elif min(rolls) == sides:
+            extra = "natural "
+            color = constants.Colours.soft_green
+
+        embed = Embed.from_dict({
+            **ROLL_EMBED_TEMPLATE,
+            "description": f"{ctx.author.mention} You have rolled {extra}{total}",
+            "color": color,
+            "footer": {"text": str(rolls[0]) if throws == 1 else ", ".join(map(str, rolls))},
+        })
 
         await ctx.send(embed=embed)
 
     @command()
     async def joke(self, ctx: Context) -> None:
         """Send a random joke."""
-        async with self.session.get("https://mrwinson.me/api/jokes/random") as resp:
-            if resp.status == 200:
-                data = await resp.json()
-                joke = data["joke"]
-                embed = Embed(
-                    description=joke,
-                    color=Color.gold()
-                )
-                await ctx.send(embed=embed)
-            else:
-                await ctx.send(f"Something went boom! :( [CODE: {resp.status}]")
+        data = await self._fetch_or_error(ctx, "https://mrwinson.me/api/jokes/random")
+        if data is None:
+            return
+
+        embed = Embed(
+            description=data["joke"],
+            color=Colour.gold()
+        )
+        await ctx.send(embed=embed)
 
     @command()
     async def koala(self, ctx: Context) -> None:
         """Get a random picture of a koala."""
-        async with self.session.get("https://some-random-api.ml/img/koala") as resp:
-            if resp.status == 200:
-                data = await resp.json()
-                embed = Embed(
-                    title="Random Koala!",
-                    color=Color.gold()
-                )
-                embed.set_image(url=data["link"])
-                await ctx.send(embed=embed)
-            else:
-                await ctx.send(f"Something went boom! :( [CODE: {resp.status}]")
+        data = await self._fetch_or_error(ctx, "https://some-random-api.ml/img/koala")
+        if data is None:
+            return
+
+        embed = Embed(
+            title="Random Koala!",
+            color=Colour.gold()
+        )
+        embed.set_image(url=data["link"])
+        await ctx.send(embed=embed)
 
     @command()
     async def panda(self, ctx: Context) -> None:
         """Get a random picture of a panda."""
-        async with self.session.get("https://some-random-api.ml/img/panda",) as resp:
-            if resp.status == 200:
-                data = await resp.json()
-                embed = Embed(
-                    title="Random Panda!",
-                    color=Color.gold(),
-                )
-                embed.set_image(url=data["link"])
-                await ctx.send(embed=embed)
-            else:
-                await ctx.send(f"Something went boom! :( [CODE: {resp.status}]")
+        data = await self._fetch_or_error(ctx, "https://some-random-api.ml/img/panda")
+        if data is None:
+            return
+
+        embed = Embed(
+            title="Random Panda!",
+            color=Colour.gold(),
+        )
+        embed.set_image(url=data["link"])
+        await ctx.send(embed=embed)
 
     @command()
     async def catfact(self, ctx: Context) -> None:
         """Send a random cat fact."""
-        async with aiohttp.ClientSession() as session:
-            async with session.get("https://cat-fact.herokuapp.com/facts") as response:
-                self.all_facts = await response.json()
-
-        fact = choice(self.all_facts["all"])
+        try:
+            async with ctx.typing():
+                cat_facts = await self._get_cat_facts()
+        except ClientResponseError as e:
+            await ctx.send(f"Something went boom! :( [CODE: {e.status}]")
+            return
+        except HTTP_ERRORS:
+            log.warning("Failed to download the cat facts", exc_info=True)
+            await ctx.send("Something went boom! :(")
+            return
+
+        fact = choice(cat_facts)
         await ctx.send(embed=Embed(
             title="Did you Know?",
-            description=fact["text"],
+            description=fact,
             color=0x690E8
         ))
 
@@ -118,7 +143,7 @@ class Fun(Cog):
     async def inspireme(self, ctx: Context) -> None:
         """Fetch a random "inspirational message" from the bot."""
         try:
-            async with self.session.get("http://inspirobot.me/api?generate=true") as page:
+            async with ctx.typing(), self._get("http://inspirobot.me/api?generate=true") as page:
                 picture = await page.text(encoding="utf-8")
                 embed = Embed()
                 embed.set_image(url=picture)
@@ -130,22 +155,68 @@ class Fun(Cog):
     @command(aliases=["shouldi", "ask"])
     async def yesno(self, ctx: Context, *, question: str) -> None:
         """Let the bot answer a yes/no question for you."""
-        async with aiohttp.ClientSession() as session:
-            async with session.get("https://yesno.wtf/api", headers=self.user_agent) as meme:
+        try:
+            async with ctx.typing(), self._get("https://yesno.wtf/api", headers=USER_AGENT) as meme:
                 if meme.status == 200:
-                    mj = await meme.json()
-                    ans = await self.get_answer(mj["answer"])
-                    em = Embed(
-                        title=ans,
-                        description=f"And the answer to {question} is this:",
-                        colour=0x690E8
-                    )
-                    em.set_image(url=mj["image"])
-                    await ctx.send(embed=em)
+                    mj = await meme.json(loads=orjson.loads)
                 else:
                     await ctx.send(f"OMFG! [STATUS : {meme.status}]")
+                    return
+        except HTTP_ERRORS:
+            log.warning("Failed to get an answer from yesno.wtf", exc_info=True)
+            await ctx.send("Something went boom! :(")
+            return
+
+        ans = mj["answer"].capitalize()
+        em = Embed(
+            title=ans,
+            description=f"And the answer to {question} is this:",
+            colour=0x690E8
+        )
+        em.set_image(url=mj["image"])
+        await ctx.send(embed=em)
+
+    def _get(self, url: str, **kwargs) -> t.AsyncContextManager[ClientResponse]:
+        """Make a GET request to `url` using the shared session, it times out after `HTTP_TIMEOUT`."""
+        return self.bot.http_session.get(url, timeout=HTTP_TIMEOUT, **kwargs)
+
+    async def _fetch_or_error(self, ctx: Context, url: str) -> t.Optional[dict]:
+        """Get the JSON response from `url`, send an error message to `ctx` and return None if the request fails."""
+        try:
+            async with ctx.typing(), self._get(url) as resp:
+                if resp.status == 200:
+                    return await resp.json(loads=orjson.loads)
+        except HTTP_ERRORS:
+            log.warning("Request to %s failed", url, exc_info=True)
+            await ctx.send("Something went boom! :(")
+            return None
+
+        await ctx.send(f"Something went boom! :( [CODE: {resp.status}]")
+        return None
+
+    async def _prefetch_cat_facts(self) -> None:
+        """Download the cat facts when the cog is loaded, so that the first `catfact` doesn't have to wait."""
+        try:
+            await self._get_cat_facts()
+        except Exception:
+            # Nothing awaits this task, an unexpected payload would otherwise only end up as an unretrieved exception
+            log.exception("Failed to prefetch the cat facts, they'll be downloaded on the first use instead")
+
+    async def _get_cat_facts(self) -> t.List[str]:
+        """Get the list of all cat facts, downloading it again only once it's older than `CAT_FACTS_TTL`."""
+        # Concurrent invocations wait for the one download instead of each making their own
+        async with self._cat_facts_lock:
+            if self._cat_facts is None or self._cat_facts_expiry < time.monotonic():
+                async with self._get(CAT_FACTS_URL) as response:
+                    response.raise_for_status()
+                    data = await response.json(loads=orjson.loads)
+                # Only keep the texts of the facts, rather than the whole API response
+                self._cat_facts = [fact["text"] for fact in data["all"]]
+                self._cat_facts_expiry = time.monotonic() + CAT_FACTS_TTL
+
+        return self._cat_facts
 
 
 def setup(bot: Bot) -> None:
-    """Load the Clean cog."""
+    """Load the Fun cog."""
     bot.add_cog(Fun(bot))
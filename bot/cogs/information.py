@@ -1,12 +1,13 @@
 import colorsys
 import logging
-import random
 import textwrap
 from collections import Counter, defaultdict
-from string import Template
-from typing import Union
+from operator import attrgetter
+from random import choice
+from typing import Dict, List, Union
 
-from discord import Colour, Embed, Guild, Member, Role, Status, utils
+from discord import Colour, Embed, Guild, Member, Role, Status
+from discord.abc import GuildChannel
 from discord.ext.commands import Cog, Context, command
 from discord.utils import escape_markdown
 
@@ -18,24 +19,192 @@ from bot.constants import (MODERATION_ROLES, NEGATIVE_REPLIES,
 from bot.converters import FetchedMember
 from bot.decorators import in_whitelist, with_role
 from bot.pagination import LinePaginator
-from bot.utils.checks import has_higher_role_check, with_role_check
+from bot.utils.checks import has_higher_role_check, with_role_set_check
 from bot.utils.time import time_since
 
 log = logging.getLogger(__name__)
 
+SOFT_RED = Colour(Colours.soft_red)
+
+# Staff roles frozen into a set once, for the role checks of the commands
+STAFF_ROLE_SET = frozenset(STAFF_ROLES)
+# Maximum amount of role mentions shown in the user info embed, the rest are only counted
+MAX_SHOWN_ROLES = 40
+# Names of the fields of the role info embed, in the order in which they're shown
+ROLE_FIELD_NAMES = ("ID", "Colour (RGB)", "Colour (HSV)", "Member count", "Position", "Permission code")
+# Rule number -> rule, the numbers are normalized to ints in case the config quoted some of them
+RULES = {int(number): rule for number, rule in Rules.rules.items()}
+
+# Descriptions of the info embeds, dedented only once. The values are inserted after the dedent is made,
+# since the multiline channel_counts lacks leading whitespace and would otherwise break the dedent.
+SERVER_INFO_TEMPLATE = textwrap.dedent(f"""
+    **Server information**
+    Created: {{created}}
+    Voice region: {{region}}
+    Features: {{features}}
+
+    **Counts**
+    Members: {{member_count:,}}
+    Roles: {{roles}}
+    {{channel_counts}}
+
+    **Members**
+    {Emojis.status_online} {{online:,}}
+    {Emojis.status_idle} {{idle:,}}
+    {Emojis.status_dnd} {{dnd:,}}
+    {Emojis.status_offline} {{offline:,}}
+""").strip()
+
+USER_INFO_TEMPLATE = textwrap.dedent("""
+    **User Information**
+    Created: {created}
+    Profile: {mention}
+    ID: {id}
+    {custom_status}
+""").strip()
+
+MEMBER_INFO_TEMPLATE = textwrap.dedent("""
+    **Member Information**
+    Joined: {joined}
+    Roles: {roles}
+""").strip()
+
 
 class Information(Cog):
     """A cog with commands for generating embeds with server info, such as server stats and user info."""
 
     def __init__(self, bot: Bot):
         self.bot = bot
+        # Guild ID -> {lowercase role name: role}, cleared whenever a role of the guild changes
+        self._roles_by_name: Dict[int, Dict[str, Role]] = {}
+        # Guild ID -> roles sorted alphabetically without @everyone, cleared whenever a role of the guild changes
+        self._sorted_roles: Dict[int, List[Role]] = {}
+        # Guild ID -> amount of members with each status, counted once and then kept up to date by the member events
+        self._status_counts: Dict[int, Counter] = {}
+        # Guild ID -> amount of channels of each type, counted once and then kept up to date by the channel events
+        self._channel_counts: Dict[int, Counter] = {}
+
+    @Cog.listener()
+    async def on_guild_role_create(self, role: Role) -> None:
+        """Clear the cached roles of the guild in which the role was created."""
+        self._clear_role_cache(role.guild.id)
+
+    @Cog.listener()
+    async def on_guild_role_update(self, before: Role, after: Role) -> None:
+        """Clear the cached roles of the guild in which the role was updated."""
+        self._clear_role_cache(after.guild.id)
+
+    @Cog.listener()
+    async def on_guild_role_delete(self, role: Role) -> None:
+        """Clear the cached roles of the guild in which the role was deleted."""
+        self._clear_role_cache(role.guild.id)
+
+    @Cog.listener()
+    async def on_member_join(self, member: Member) -> None:
+        """Count the status of the member who joined."""
+        statuses = self._status_counts.get(member.guild.id)
+        if statuses is not None:
+            statuses[member.status] += 1
+
+    @Cog.listener()
+    async def on_member_remove(self, member: Member) -> None:
+        """Stop counting the status of the member who left."""
+        statuses = self._status_counts.get(member.guild.id)
+        if statuses is not None:
+            statuses[member.status] -= 1
+
+    @Cog.listener()
+    async def on_member_update(self, before: Member, after: Member) -> None:
+        """Move the member to their new status in the status counts, presence updates are dispatched here too."""
+        if before.status is after.status:
+            return
+
+        statuses = self._status_counts.get(after.guild.id)
+        if statuses is not None:
+            statuses[before.status] -= 1
+            statuses[after.status] += 1
+
+    @Cog.listener()
+    async def on_guild_channel_create(self, channel: GuildChannel) -> None:
+        """Count the type of the created channel."""
+        channels = self._channel_counts.get(channel.guild.id)
+        if channels is not None:
+            channels[channel.type] += 1
+
+    @Cog.listener()
+    async def on_guild_channel_delete(self, channel: GuildChannel) -> None:
+        """Stop counting the type of the deleted channel."""
+        channels = self._channel_counts.get(channel.guild.id)
+        if channels is not None:
+            channels[channel.type] -= 1
+            if not channels[channel.type]:
+                # Don't show channel types with no channels left
+                del channels[channel.type]
+
+    @Cog.listener()
+    async def on_guild_channel_update(self, before: GuildChannel, after: GuildChannel) -> None:
+        """Move the channel to its new type in the channel counts, text channels can be converted to news ones."""
+        if before.type is not after.type:
+            await self.on_guild_channel_delete(before)
+            await self.on_guild_channel_create(after)
+
+    @Cog.listener()
+    async def on_guild_available(self, guild: Guild) -> None:
+        """Count everything again, member and channel events could've been missed while the guild was unavailable."""
+        self._status_counts.pop(guild.id, None)
+        self._channel_counts.pop(guild.id, None)
+
+    @Cog.listener()
+    async def on_guild_remove(self, guild: Guild) -> None:
+        """Forget everything cached for the guild which the bot left."""
+        self._clear_role_cache(guild.id)
+        self._status_counts.pop(guild.id, None)
+        self._channel_counts.pop(guild.id, None)
+
+    def _clear_role_cache(self, guild_id: int) -> None:
+        """Forget all of the cached roles of the guild."""
+        self._roles_by_name.pop(guild_id, None)
+        self._sorted_roles.pop(guild_id, None)
+
+    def _get_status_counts(self, guild: Guild) -> Counter:
+        """Get the amount of members of the guild with each status, the members are only counted on first use."""
+        statuses = self._status_counts.get(guild.id)
+        if statuses is None:
+            # Let `map` and `attrgetter` walk the members in C, there can be tens of thousands of them
+            statuses = Counter(map(attrgetter("status"), guild.members))
+            self._status_counts[guild.id] = statuses
+        return statuses
+
+    def _get_channel_counts(self, guild: Guild) -> Counter:
+        """Get the amount of channels of the guild of each type, the channels are only counted on first use."""
+        channels = self._channel_counts.get(guild.id)
+        if channels is None:
+            channels = Counter(map(attrgetter("type"), guild.channels))
+            self._channel_counts[guild.id] = channels
+        return channels
+
+    def _get_roles_by_name(self, guild: Guild) -> Dict[str, Role]:
+        """Get a mapping of lowercase role names to the roles of the guild."""
+        roles_by_name = self._roles_by_name.get(guild.id)
+        if roles_by_name is None:
+            # Build the mapping from the top role, so that the lowest role wins when names collide
+            roles_by_name = {role.name.lower(): role for role in reversed(guild.roles)}
+            self._roles_by_name[guild.id] = roles_by_name
+        return roles_by_name
+
+    def _get_sorted_roles(self, guild: Guild) -> List[Role]:
+        """Get the roles of the guild sorted alphabetically, without the @everyone role."""
+        roles = self._sorted_roles.get(guild.id)
+        if roles is None:
+            roles = sorted(guild.roles[1:], key=attrgetter("name"))
+            self._sorted_roles[guild.id] = roles
+        return roles
 
     @with_role(*MODERATION_ROLES)
     @command(name="roles")
     async def roles_info(self, ctx: Context) -> None:
         """Returns a list of all roles and their corresponding IDs."""
-        # Sort the roles alphabetically and remove the @everyone role
-        roles = sorted(ctx.guild.roles[1:], key=lambda role: role.name)
+        roles = self._get_sorted_roles(ctx.guild)
 
         # Build a list
         role_list = []
@@ -60,6 +229,7 @@ class Information(Cog):
         """
         parsed_roles = []
         failed_roles = []
+        roles_by_name = self._get_roles_by_name(ctx.guild)
 
         for role_name in roles:
             if isinstance(role_name, Role):
@@ -67,8 +237,7 @@ class Information(Cog):
                 parsed_roles.append(role_name)
                 continue
 
-            role = utils.find(
-                lambda r: r.name.lower() == role_name.lower(), ctx.guild.roles)
+            role = roles_by_name.get(role_name.lower())
 
             if not role:
                 failed_roles.append(role_name)
@@ -81,25 +250,36 @@ class Information(Cog):
             msg += "\n-".join(failed_roles)
             await ctx.send(msg)
 
-        for role in parsed_roles:
-            h, s, v = colorsys.rgb_to_hsv(*role.colour.to_rgb())
+        # Build all of the embeds first, they're sent one by one so that they keep the order of the arguments
+        embeds = [self._build_role_embed(role) for role in parsed_roles]
+        for embed in embeds:
+            await ctx.send(embed=embed)
 
-            embed = Embed(
-                title=f"{role.name} info",
-                colour=role.colour,
-            )
-            embed.add_field(name="ID", value=role.id, inline=True)
-            embed.add_field(name="Colour (RGB)",
-                            value=f"#{role.colour.value:0>6x}", inline=True)
-            embed.add_field(name="Colour (HSV)",
-                            value=f"{h:.2f} {s:.2f} {v}", inline=True)
-            embed.add_field(name="Member count", value=len(
-                role.members), inline=True)
-            embed.add_field(name="Position", value=role.position)
-            embed.add_field(name="Permission code",
-                            value=role.permissions.value, inline=True)
+    @staticmethod
+    def _build_role_embed(role: Role) -> Embed:
+        """Build an embed with information about the role."""
+        colour = role.colour.value
+        h, s, v = colorsys.rgb_to_hsv((colour >> 16) & 0xFF, (colour >> 8) & 0xFF, colour & 0xFF)
+        values = (
+            role.id,
+            f"#{colour:0>6x}",
+            f"{h:.2f} {s:.2f} {v}",
+            len(role.members),
+            role.position,
+            role.permissions.value,
+        )
 
-            await ctx.send(embed=embed)
+        embed = Embed.from_dict({
+            "type": "rich",
+            "title": f"{role.name} info",
+            "color": colour,
+            "fields": [
+                {"name": name, "value": str(value), "inline": True}
+                for name, value in zip(ROLE_FIELD_NAMES, values)
+            ],
+        })
+
+        return embed
 
     @command(name="server", aliases=["server_info", "guild", "guild_info"])
     async def server_info(self, ctx: Context) -> None:
@@ -112,37 +292,25 @@ class Information(Cog):
         member_count = ctx.guild.member_count
 
         # How many of each type of channel?
-        channels = Counter(c.type for c in ctx.guild.channels)
-        channel_counts = "".join(sorted(
-            f"{str(ch).title()} channels: {channels[ch]}\n" for ch in channels)).strip()
+        channels = self._get_channel_counts(ctx.guild)
+        channel_counts = "\n".join(
+            f"{str(ch).title()} channels: {channels[ch]}" for ch in sorted(channels, key=str))
 
         # How many of each user status?
-        statuses = Counter(member.status for member in ctx.guild.members)
+        statuses = self._get_status_counts(ctx.guild)
         embed = Embed(colour=Colour.blurple())
-
-        # Because channel_counts lacks leading whitespace, it breaks the dedent if it's inserted directly by the
-        # f-string. While this is correctly formated by Discord, it makes unit testing difficult. To keep the formatting
-        # without joining a tuple of strings we can use a Template string to insert the already-formatted channel_counts
-        # after the dedent is made.
-        embed.description = Template(
-            textwrap.dedent(f"""
-                **Server information**
-                Created: {created}
-                Voice region: {region}
-                Features: {features}
-
-                **Counts**
-                Members: {member_count:,}
-                Roles: {roles}
-                $channel_counts
-
-                **Members**
-                {Emojis.status_online} {statuses[Status.online]:,}
-                {Emojis.status_idle} {statuses[Status.idle]:,}
-                {Emojis.status_dnd} {statuses[Status.dnd]:,}
-                {Emojis.status_offline} {statuses[Status.offline]:,}
-            """)
-        ).substitute({"channel_counts": channel_counts})
+        embed.description = SERVER_INFO_TEMPLATE.format(
+            created=created,
+            region=region,
+            features=features,
+            member_count=member_count,
+            roles=roles,
+            channel_counts=channel_counts,
+            online=statuses[Status.online],
+            idle=statuses[Status.idle],
+            dnd=statuses[Status.dnd],
+            offline=statuses[Status.offline],
+        )
         embed.set_thumbnail(url=ctx.guild.icon_url)
 
         await ctx.send(embed=embed)
@@ -155,7 +323,7 @@ class Information(Cog):
             user = ctx.author
 
         # Do a role check if this is being executed on someone other than the caller
-        elif user != ctx.author and not with_role_check(ctx, *STAFF_ROLES):
+        elif user != ctx.author and not with_role_set_check(ctx, STAFF_ROLE_SET):
             await ctx.send("You may not use this command on users other than yourself.")
             return
 
@@ -170,28 +338,31 @@ class Information(Cog):
 
         # TODO: Handle too long message
 
+        is_staff = with_role_set_check(ctx, STAFF_ROLE_SET)
+
         if user is None:
             user = ctx.author
 
         # Do a role check if this is being executed on someone other than the caller
-        elif user != ctx.author and not with_role_check(ctx, *STAFF_ROLES):
+        elif user != ctx.author and not is_staff:
             await ctx.send("You may not use this command on users other than yourself.")
             return
 
         # Prevent usage on someone with higher role
         if not has_higher_role_check(ctx, user):
             embed = Embed(
-                color=Colours.soft_red,
-                title=random.choice(NEGATIVE_REPLIES),
+                color=SOFT_RED,
+                title=choice(NEGATIVE_REPLIES),
                 description="You may not use this command on users with higher role than yours"
             )
             await ctx.send(embed=embed)
             return
 
-        embed = await self.create_infractions_embed(ctx, user)
+        infs = infractions.get_infractions(user)
+        embed = await self.create_infractions_embed(ctx, user, infs)
 
         # Send infractions as DM, if user has any (bypass for staff members)
-        if not with_role_check(ctx, *STAFF_ROLES) and not len(infractions.get_infractions(user)) == 0:
+        if not is_staff and not len(infs) == 0:
             msg = f"Your infraction list was sent to you by DM, {user.mention}"
             await user.send(embed=embed)
             await ctx.send(msg)
@@ -212,9 +383,9 @@ class Information(Cog):
                 # Preform a role check if the user is found
                 if not has_higher_role_check(ctx, user):
                     embed = Embed(
-                        title=random.choice(NEGATIVE_REPLIES),
+                        title=choice(NEGATIVE_REPLIES),
                         description="You don't have permission to access this infraction",
-                        colour=Colours.soft_red
+                        colour=SOFT_RED
                     )
                     await ctx.send(embed=embed)
                     return
@@ -236,15 +407,15 @@ class Information(Cog):
             """).strip()
 
             embed = Embed(
-                title=random.choice(POSITIVE_REPLIES),
+                title=choice(POSITIVE_REPLIES),
                 description=description,
                 colour=Colour.blurple()
             )
         else:
             embed = Embed(
-                title=random.choice(NEGATIVE_REPLIES),
+                title=choice(NEGATIVE_REPLIES),
                 description="No such infraction",
-                colour=Colours.soft_red
+                colour=SOFT_RED
             )
 
         await ctx.send(embed=embed)
@@ -258,10 +429,8 @@ class Information(Cog):
     @command()
     async def rule(self, ctx: Context, number: int) -> None:
         """Show detailed info about given rule"""
-        rules = Rules.rules
-        try:
-            rule = rules[number]
-        except KeyError:
+        rule = RULES.get(number)
+        if rule is None:
             await ctx.send(f"{Emojis.cross_mark} No such rule ({number})")
             return
 
@@ -273,56 +442,63 @@ class Information(Cog):
         await ctx.send(embed=embed)
     # region: Infractions sub-functions
 
+    @staticmethod
+    def _display_name(user: FetchedMember) -> str:
+        """Get the name of the user shown in the embed titles, including the nickname of members."""
+        if isinstance(user, Member) and user.nick:
+            return f"{user.nick} ({user})"
+        return str(user)
+
     async def create_user_embed(self, ctx: Context, user: FetchedMember) -> Embed:
         """Creates an embed containing information on the `user`."""
         created = time_since(user.created_at, max_units=3)
 
-        name = str(user)
+        name = self._display_name(user)
         custom_status = ""
-        if isinstance(user, Member):
-            if user.nick:
-                name = f"{user.nick} ({name})"
-
+        is_member = isinstance(user, Member)
+        if is_member:
             mention = user.mention
 
             joined = time_since(user.joined_at, precision="days")
-            roles = ", ".join(role.mention for role in user.roles[1:])
+            member_roles = user.roles[1:]
+            has_roles = bool(member_roles)
+            roles = ", ".join([role.mention for role in member_roles[:MAX_SHOWN_ROLES]])
+            if len(member_roles) > MAX_SHOWN_ROLES:
+                roles += f" (+{len(member_roles) - MAX_SHOWN_ROLES} more)"
 
-            for activity in user.activities:
+            if user.activities:
                 # Check activity.state for None value if user has a custom status set
                 # This guards against a custom status with an emoji but no text, which will cause
                 # escape_markdown to raise an exception
                 # This can be reworked after a move to d.py 1.3.0+, which adds a CustomActivity class
-                if activity.name == "Custom Status" and activity.state:
+                activity = next(
+                    (
+                        activity for activity in user.activities
+                        if activity.name == "Custom Status" and activity.state
+                    ),
+                    None
+                )
+                if activity is not None:
                     state = escape_markdown(activity.state)
                     custom_status = f"Status: {state}\n"
         else:
-            roles = None
+            has_roles = False
             mention = f"{user.name}#{user.discriminator}"
 
         description = [
-            textwrap.dedent(f"""
-                **User Information**
-                Created: {created}
-                Profile: {mention}
-                ID: {user.id}
-                {custom_status}
-            """).strip()
+            USER_INFO_TEMPLATE.format(created=created, mention=mention, id=user.id, custom_status=custom_status).rstrip()
         ]
-        if isinstance(user, Member):
+        if is_member:
             description[0] += "\n"
-            description[0] += textwrap.dedent(f"""
-                **Member Information**
-                Joined: {joined}
-                Roles: {roles or None}
-            """).strip()
+            description[0] += MEMBER_INFO_TEMPLATE.format(joined=joined, roles=roles or None)
 
         if has_higher_role_check(ctx, user):
+            infs = infractions.get_infractions(user)
             # Show more verbose output in staff channels for infractions
-            if ctx.channel.id in STAFF_CHANNELS and with_role_check(ctx, *STAFF_ROLES):
-                description.append(await self.expanded_user_infraction_counts(user))
+            if ctx.channel.id in STAFF_CHANNELS and with_role_set_check(ctx, STAFF_ROLE_SET):
+                description.append(await self.expanded_user_infraction_counts(infs))
             else:
-                description.append(await self.basic_user_infraction_counts(user))
+                description.append(await self.basic_user_infraction_counts(infs))
 
         # Let's build the embed now
         embed = Embed(
@@ -331,23 +507,18 @@ class Information(Cog):
         )
 
         embed.set_thumbnail(url=user.avatar_url_as(format="png"))
-        embed.colour = user.top_role.colour if roles else Colour.blurple()
+        embed.colour = user.top_role.colour if has_roles else Colour.blurple()
 
         return embed
 
-    async def create_infractions_embed(self, ctx: Context, user: FetchedMember) -> Embed:
-        """Create an embed containing information on user's infractions"""
+    async def create_infractions_embed(self, ctx: Context, user: FetchedMember, infs: list) -> Embed:
+        """Create an embed containing information on user's infractions `infs`"""
 
-        name = str(user)
-        if isinstance(user, Member):
-            if user.nick:
-                name = f"{user.nick} ({name})"
+        name = self._display_name(user)
+        # Every member has the @everyone role
+        has_roles = isinstance(user, Member) and len(user.roles) > 1
 
-            roles = user.roles[1:]
-        else:
-            roles = []
-
-        description = await self.full_user_infraction_counts(ctx, user)
+        description = await self.full_user_infraction_counts(ctx, infs)
 
         embed = Embed(
             title=name,
@@ -355,51 +526,39 @@ class Information(Cog):
         )
 
         embed.set_thumbnail(url=user.avatar_url_as(format="png"))
-        embed.colour = user.top_role.colour if roles else Colour.blurple()
+        embed.colour = user.top_role.colour if has_roles else Colour.blurple()
 
         return embed
 
-    async def basic_user_infraction_counts(self, member: FetchedMember) -> str:
-        """Gets the total and active infraction counts for the given `member`."""
-        infs = infractions.get_infractions(member)
-        active_infs = infractions.get_active_infractions(member)
-
+    async def basic_user_infraction_counts(self, infs: list) -> str:
+        """Gets the total and active infraction counts from the infractions `infs` of a member."""
         total_infractions = len(infs)
-        active_infractions = len(active_infs)
+        active_infractions = sum(1 for infraction in infs if infraction.is_active)
 
         infraction_output = f"**Infractions**\nTotal: {total_infractions}\nActive: {active_infractions}"
 
         return infraction_output
 
-    async def expanded_user_infraction_counts(self, member: FetchedMember) -> str:
+    async def expanded_user_infraction_counts(self, infs: list) -> str:
         """
-        Gets expanded infraction counts for the given `member`.
+        Gets expanded infraction counts from the infractions `infs` of a member.
 
         The counts will be split by infraction type and the number of active infractions for each type will indicated
         in the output as well.
         """
-        infs = infractions.get_infractions(member)
-
         infraction_output = ["**Infractions**"]
         if not infs:
             infraction_output.append(
                 "This user has never received an infraction.")
         else:
             # Count infractions split by `type` and `active` status for this user
-            infraction_types = set()
-            infraction_counter = defaultdict(int)
-            for infraction in infs:
-                infraction_type = infraction.type
-                infraction_active = "active" if infraction.is_active else "inactive"
-
-                infraction_types.add(infraction_type)
-                infraction_counter[f"{infraction_active} {infraction_type}"] += 1
+            infraction_counter = Counter((infraction.type, infraction.is_active) for infraction in infs)
+            infraction_types = {infraction_type for infraction_type, _ in infraction_counter}
 
             # Format the output of the infraction counts
             for infraction_type in sorted(infraction_types):
-                active_count = infraction_counter[f"active {infraction_type}"]
-                total_count = active_count + \
-                    infraction_counter[f"inactive {infraction_type}"]
+                active_count = infraction_counter[infraction_type, True]
+                total_count = active_count + infraction_counter[infraction_type, False]
 
                 line = f"{infraction_type.capitalize()}s: {total_count}"
                 if active_count:
@@ -409,9 +568,9 @@ class Information(Cog):
 
         return "\n".join(infraction_output)
 
-    async def full_user_infraction_counts(self, ctx: Context, member: FetchedMember) -> str:
+    async def full_user_infraction_counts(self, ctx: Context, infs: list) -> str:
         """
-        Gets full infraction info with descriptions for the given member
+        Gets full infraction info with descriptions from the infractions `infs` of a member
 
         The counts will be split by `active` status and infraction `type`
         """
@@ -428,32 +587,33 @@ class Information(Cog):
                 # Append the infraction to infractions_dict with type as key
                 infractions_dict[infraction_type].append(infraction)
 
-            line = "```yaml\n"
+            # Resolve each distinct actor once, only from the member cache, a single actor often gave many infractions
+            actors = {}
+            for actor_id in {infraction.actor_id for infraction in all_infractions}:
+                actor = guild.get_member(actor_id)
+                if isinstance(actor, Member):
+                    actors[actor_id] = f"{actor.name}#{actor.discriminator}"
+                else:
+                    actors[actor_id] = actor_id
+
+            parts = ["```yaml\n"]
             for infraction_type in sorted(infraction_types):
                 # Get total infraction amount
                 infractions_amt = len(infractions_dict[infraction_type])
-                line += f"{infraction_type}s: {infractions_amt}\n"
+                parts.append(f"{infraction_type}s: {infractions_amt}\n")
                 # Print details about infractions with current type
                 for infraction in infractions_dict[infraction_type]:
-                    # Get actors name if possible
-                    actor = guild.get_member(infraction.actor_id)
-                    if not isinstance(actor, Member):
-                        actor = infraction.actor_id
-                    else:
-                        actor = f"{actor.name}#{actor.discriminator}"
-
-                    line += f"  - {(infraction.reason)}\n"
-                    line += f"      ID: {infraction.id}\n"
-                    line += f"      duration: {infraction.str_duration}\n"
-                    line += f"      given: {infraction.time_since_start}\n"
-                    line += f"      actor: {actor}\n"
-            line = line[:-1]
-            line += "```"
-
-            return line
-
-        active_infs = infractions.get_active_infractions(member)
-        inactive_infs = infractions.get_inactive_infractions(member)
+                    parts.append(
+                        f"  - {(infraction.reason)}\n"
+                        f"      ID: {infraction.id}\n"
+                        f"      duration: {infraction.str_duration}\n"
+                        f"      given: {infraction.time_since_start}\n"
+                        f"      actor: {actors[infraction.actor_id]}\n"
+                    )
+            return "".join(parts).rstrip("\n") + "```"
+
+        active_infs = [infraction for infraction in infs if infraction.is_active]
+        inactive_infs = [infraction for infraction in infs if not infraction.is_active]
         guild = ctx.guild
 
         if not active_infs and not inactive_infs:
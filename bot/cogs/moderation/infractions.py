@@ -5,7 +5,7 @@ from datetime import datetime
 
 import discord
 from dateutil.relativedelta import relativedelta
-from discord import Embed, Member, Object
+from discord import Colour, Embed, Member, Object
 from discord.ext import commands
 from discord.ext.commands import Context, command
 
@@ -15,7 +15,6 @@ from bot.constants import Event
 from bot.converters import Expiry, FetchedMember
 from bot.decorators import respect_role_hierarchy, with_role
 from bot.utils import infractions
-from bot.utils.checks import has_higher_role_check
 
 from . import utils
 from .modlog import ModLog
@@ -24,6 +23,13 @@ from .utils import UserSnowflake
 
 log = logging.getLogger(__name__)
 
+SOFT_RED = Colour(constants.Colours.soft_red)
+
+
+def _error_embed(description: str) -> Embed:
+    """Create an error embed with the `description` and a random negative reply as its title."""
+    return Embed(title=random.choice(constants.NEGATIVE_REPLIES), description=description, colour=SOFT_RED)
+
 
 class Infractions(InfractionScheduler, commands.Cog):
     def __init__(self, bot: Bot) -> None:
@@ -37,34 +43,18 @@ class Infractions(InfractionScheduler, commands.Cog):
 
     # region: Checks
 
-    async def check_bot(self, ctx: Context, user: Member, command: str) -> bool:
-        """Check user is not a bot"""
-        if user.bot:
-            # Build an embed
-            embed = Embed(
-                title=random.choice(constants.NEGATIVE_REPLIES),
-                description=f"You can't use {command} on bot users",
-                colour=constants.Colours.soft_red
-            )
-            await ctx.send(embed=embed)
-            return True
-        else:
-            return False
-
-    async def check_role(self, ctx: Context, user: Member, command: str) -> bool:
-        """Check if author can use this command to specified user"""
-        if not has_higher_role_check(ctx, user):
-            # Build an embed
-            embed = Embed(
-                title=random.choice(constants.NEGATIVE_REPLIES),
-                description=f"You can't use {command} on this user",
-                colour=constants.Colours.soft_red
-            )
-            await ctx.send(embed=embed)
-            return False
-        else:
+    async def _precheck(self, ctx: Context, user: UserSnowflake, command: str) -> bool:
+        """
+        Check that the user isn't a bot, sending an error message if they are.
+
+        The role hierarchy is checked by the `respect_role_hierarchy` decorator of the apply functions.
+        """
+        if not user.bot:
             return True
 
+        await ctx.send(embed=_error_embed(f"You can't use {command} on bot users"))
+        return False
+
     # endregion
     # region: Permanent infractions
 
@@ -72,6 +62,8 @@ class Infractions(InfractionScheduler, commands.Cog):
     @command()
     async def warn(self, ctx: Context, user: FetchedMember, *, reason: str = None) -> None:
         """Warn a user for a given reason"""
+        if not await self._precheck(ctx, user, "warn"):
+            return
 
         await self.apply_warn(ctx, user, reason)
 
@@ -197,19 +189,11 @@ class Infractions(InfractionScheduler, commands.Cog):
         # Determine if the user has any active ban infractions that override the current one
         for inf in infs:
             if inf.duration == 1_000_000_000:
-                embed = Embed(
-                    title=random.choice(constants.NEGATIVE_REPLIES),
-                    description="This user is already banned permanently",
-                    color=constants.Colours.soft_red
-                )
+                embed = _error_embed("This user is already banned permanently")
                 await ctx.send(embed=embed)
                 return
             if inf.stop > (datetime.now() + relativedelta(seconds=duration)):
-                embed = Embed(
-                    title=random.choice(constants.NEGATIVE_REPLIES),
-                    description=f"This user is already banned\n(Currents ban ends at: {inf.stop})",
-                    color=constants.Colours.soft_red
-                )
+                embed = _error_embed(f"This user is already banned\n(Currents ban ends at: {inf.stop})")
                 await ctx.send(embed=embed)
                 return
 
@@ -249,19 +233,11 @@ class Infractions(InfractionScheduler, commands.Cog):
         # Determine if the user has any active mute infractions that override the current one
         for inf in infs:
             if inf.duration == 1_000_000_000:
-                embed = Embed(
-                    title=random.choice(constants.NEGATIVE_REPLIES),
-                    description="This user is already muted permanently",
-                    color=constants.Colours.soft_red
-                )
+                embed = _error_embed("This user is already muted permanently")
                 await ctx.send(embed=embed)
                 return
             if inf.stop > (datetime.now() + relativedelta(seconds=duration)):
-                embed = Embed(
-                    title=random.choice(constants.NEGATIVE_REPLIES),
-                    description=f"This user is already muted\n(Currents mute ends at: {inf.stop})",
-                    color=constants.Colours.soft_red
-                )
+                embed = _error_embed(f"This user is already muted\n(Currents mute ends at: {inf.stop})")
                 await ctx.send(embed=embed)
                 return
 
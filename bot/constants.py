@@ -368,7 +368,7 @@ STAFF_CHANNELS = Guild.staff_channels
 
 
 # Bot replies
-NEGATIVE_REPLIES = [
+NEGATIVE_REPLIES = (
     "Noooooo!!",
     "Nope.",
     "I don't think so.",
@@ -380,9 +380,9 @@ NEGATIVE_REPLIES = [
     "Nuh-uh",
     "Not in a million years.",
     "Not likely."
-]
+)
 
-POSITIVE_REPLIES = [
+POSITIVE_REPLIES = (
     "Yep.",
     "Absolutely!",
     "Can do!",
@@ -397,9 +397,9 @@ POSITIVE_REPLIES = [
     "Of course!",
     "I got you.",
     "Yeah okay.",
-]
+)
 
-ERROR_REPLIES = [
+ERROR_REPLIES = (
     "Please don't do that.",
     "You have to stop.",
     "That was a mistake.",
@@ -408,4 +408,4 @@ ERROR_REPLIES = [
     "Are you trying to kill me?",
     "Noooooo!!",
     "I can't believe you've done this",
-]
+)
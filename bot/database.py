@@ -6,6 +6,9 @@ from bot.constants import Database
 
 log = logging.getLogger(__name__)
 
+# Bump this whenever the tables in `SQLite.create_init_tables` change
+SCHEMA_VERSION = 1
+
 
 class SQLite():
     def __init__(self):
@@ -20,21 +23,34 @@ class SQLite():
         self.conn.commit()
 
     def create_init_tables(self):
-        try:
-            self.execute("""CREATE TABLE infractions(
-                            UID INTEGER,
-                            Type TEXT,
-                            Reason TEXT,
-                            ActorID INTEGER,
-                            Start TEXT,
-                            Duration INTEGER,
-                            Active INTEGER
-                            );""")
-            self.execute("""CREATE TABLE users(
-                            UID INTEGER,
-                            Muted INTEGER,
-                            Banned INTEGER
-                            );""")
-            log.info("Database tables created")
-        except lite.OperationalError:
+        """
+        Create the database tables, unless they're already up to date.
+
+        The schema version is stored in `PRAGMA user_version`, so once the tables
+        are created, this only needs to read the version.
+        """
+        self.cur.execute("PRAGMA user_version;")
+        if self.cur.fetchone()[0] >= SCHEMA_VERSION:
             log.debug("Tables exists")
+            return
+
+        self.cur.executescript(f"""
+            BEGIN IMMEDIATE;
+            CREATE TABLE IF NOT EXISTS infractions(
+                UID INTEGER,
+                Type TEXT,
+                Reason TEXT,
+                ActorID INTEGER,
+                Start TEXT,
+                Duration INTEGER,
+                Active INTEGER
+            );
+            CREATE TABLE IF NOT EXISTS users(
+                UID INTEGER,
+                Muted INTEGER,
+                Banned INTEGER
+            );
+            PRAGMA user_version = {SCHEMA_VERSION};
+            COMMIT;
+        """)
+        log.info("Database tables created")
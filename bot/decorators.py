@@ -12,7 +12,7 @@ from discord.ext import commands
 from discord.ext.commands import CheckFailure, Cog, Context
 
 from bot.constants import ERROR_REPLIES, Channels, Emojis, RedirectOutput
-from bot.utils.checks import with_role_check, without_role_check
+from bot.utils.checks import with_role_set_check, without_role_check
 
 log = logging.getLogger(__name__)
 
@@ -103,9 +103,12 @@ def in_whitelist(
 
 def with_role(*role_ids: int) -> Callable:
     """Returns True if the user has any one of the roles in role_ids."""
+    # Freeze the roles once, rather than on every invocation of the command
+    role_set = frozenset(role_ids)
+
     async def predicate(ctx: Context) -> bool:
         """With role checker predicate."""
-        if with_role_check(ctx, *role_ids):
+        if with_role_set_check(ctx, role_set):
             return True
         raise PermissionCheckFailure(ctx)
     return commands.check(predicate)
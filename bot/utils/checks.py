@@ -1,6 +1,6 @@
 import datetime
 import logging
-from typing import Callable, Iterable
+from typing import AbstractSet, Callable, Iterable
 
 from discord import Member
 from discord.ext.commands import (BucketType, Cog, Command, CommandOnCooldown,
@@ -11,6 +11,11 @@ log = logging.getLogger(__name__)
 
 def with_role_check(ctx: Context, *role_ids: int) -> bool:
     """Returns True if the user has any one of the roles in role_ids."""
+    return with_role_set_check(ctx, frozenset(role_ids))
+
+
+def with_role_set_check(ctx: Context, role_ids: AbstractSet[int]) -> bool:
+    """Returns True if the user has any one of the roles in the role_ids set."""
     if not ctx.guild:  # Return False in a DM
         log.debug(f"{ctx.author} tried to use the '{ctx.command.name}'command from a DM. "
                   "This command is restricted by the with_role decorator. Rejecting request.")
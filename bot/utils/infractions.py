@@ -1,5 +1,8 @@
 import datetime
 import logging
+import typing as t
+from collections import OrderedDict
+from time import monotonic
 
 from dateutil.relativedelta import relativedelta
 
@@ -10,6 +13,11 @@ from bot.utils import time
 
 log = logging.getLogger(__name__)
 
+# Time (in seconds) for which the infractions of a user are cached, the cache is also cleared on every change
+INFRACTIONS_CACHE_TTL = 30
+# Maximum amount of users with cached infractions, the least recently used one gets dropped
+INFRACTIONS_CACHE_SIZE = 1024
+
 
 class Infraction:
     def __init__(self,
@@ -93,6 +101,7 @@ class Infraction:
         db.execute(sql_find_command, sql_find_args)
         self.id = db.cur.fetchone()[0]
         db.close()
+        _invalidate_cache(self.user_id)
 
     def make_inactive(self) -> None:
         """Set infraction Active state to 0 in database"""
@@ -105,6 +114,7 @@ class Infraction:
         db = SQLite()
         db.execute(sql_command, sql_args)
         db.close()
+        _invalidate_cache(self.user_id)
 
 
 def get_infraction_by_row(row_id: int) -> Infraction:
@@ -138,60 +148,63 @@ def get_all_active_infractions(inf_type: str = None) -> list:
         return all_infractions
 
 
-def get_infractions(user: UserSnowflake, inf_type: str = None) -> list:
-    log.debug(f"Getting infractions of {user}")
+# User ID -> (expiry time, all infractions of the user)
+_infractions_cache: t.OrderedDict[int, t.Tuple[float, t.List[Infraction]]] = OrderedDict()
+
+
+def _get_user_infractions(user_id: int) -> t.List[Infraction]:
+    """Get all infractions of the user, the database is only queried once the cached ones expire."""
+    now = monotonic()
+    cached = _infractions_cache.get(user_id)
+    if cached is not None and cached[0] > now:
+        _infractions_cache.move_to_end(user_id)
+        return cached[1]
 
-    # Get all infractions from database
     db = SQLite()
-    db.execute("SELECT *, rowid FROM infractions WHERE UID=?", (user.id, ))
-    infractions = [infraction for infraction in db.cur.fetchall()]
+    db.execute("SELECT *, rowid FROM infractions WHERE UID=?", (user_id, ))
+    user_infractions = [Infraction(*infraction) for infraction in db.cur.fetchall()]
     db.close()
 
-    # Convert infractions to Infraction class
-    all_infractions = [Infraction(*infraction) for infraction in infractions]
+    _infractions_cache[user_id] = (now + INFRACTIONS_CACHE_TTL, user_infractions)
+    _infractions_cache.move_to_end(user_id)
+    if len(_infractions_cache) > INFRACTIONS_CACHE_SIZE:
+        _infractions_cache.popitem(last=False)
 
-    if inf_type:
-        return [infraction for infraction in all_infractions if infraction.type == inf_type]
-    else:
-        return all_infractions
+    return user_infractions
 
 
-def get_active_infractions(user: UserSnowflake, inf_type: str = None) -> list:
-    log.debug(f"Getting active infractions of {user}")
+def _invalidate_cache(user_id: int) -> None:
+    """Drop the cached infractions of the user, this needs to be done after every change in the database."""
+    _infractions_cache.pop(user_id, None)
 
-    # Get all infractions from database
-    db = SQLite()
-    db.execute(
-        "SELECT *, rowid FROM infractions WHERE UID=? AND Active=1", (user.id, ))
-    infractions = [infraction for infraction in db.cur.fetchall()]
-    db.close()
 
-    # Convert infractions to Infraction class
-    all_infractions = [Infraction(*infraction) for infraction in infractions]
+def get_infractions(user: UserSnowflake, inf_type: str = None) -> list:
+    log.debug(f"Getting infractions of {user}")
+
+    all_infractions = _get_user_infractions(user.id)
 
     if inf_type:
         return [infraction for infraction in all_infractions if infraction.type == inf_type]
     else:
-        return all_infractions
+        return list(all_infractions)
 
 
-def get_inactive_infractions(user: UserSnowflake, inf_type: str = None) -> list:
-    log.debug(f"Getting inactive infractions of {user}")
+def get_active_infractions(user: UserSnowflake, inf_type: str = None) -> list:
+    log.debug(f"Getting active infractions of {user}")
 
-    # Get all infractions from database
-    db = SQLite()
-    db.execute(
-        "SELECT *, rowid FROM infractions WHERE UID=? AND Active=0", (user.id, ))
-    infractions = [infraction for infraction in db.cur.fetchall()]
-    db.close()
+    return [
+        infraction for infraction in _get_user_infractions(user.id)
+        if infraction.is_active and (not inf_type or infraction.type == inf_type)
+    ]
 
-    # Convert infractions to Infraction class
-    all_infractions = [Infraction(*infraction) for infraction in infractions]
 
-    if inf_type:
-        return [infraction for infraction in all_infractions if infraction.type == inf_type]
-    else:
-        return all_infractions
+def get_inactive_infractions(user: UserSnowflake, inf_type: str = None) -> list:
+    log.debug(f"Getting inactive infractions of {user}")
+
+    return [
+        infraction for infraction in _get_user_infractions(user.id)
+        if not infraction.is_active and (not inf_type or infraction.type == inf_type)
+    ]
 
 
 def remove_infraction(infraction: Infraction) -> None:
@@ -199,3 +212,4 @@ def remove_infraction(infraction: Infraction) -> None:
     db = SQLite()
     db.execute("DELETE FROM infractions WHERE rowid=?", (row_id, ))
     db.close()
+    _invalidate_cache(infraction.user_id)
@@ -0,0 +1,40 @@
+import asyncio
+import unittest
+
+from bot.cogs import embeds
+from tests.helpers import MockBot, MockContext
+
+
+class EmbedsAckTests(unittest.TestCase):
+    """Tests the merged confirmations of the `Embeds` cog."""
+
+    def setUp(self):
+        self.bot = MockBot()
+        self.cog = embeds.Embeds(self.bot)
+        self.ctx = MockContext(bot=self.bot)
+        self.events = []
+
+        async def slow_send(content=None, **kwargs):
+            self.events.append(("start", content))
+            await asyncio.sleep(1)
+            self.events.append(("end", content))
+
+        self.ctx.send.side_effect = slow_send
+
+    def test_reply_waits_for_every_batch_being_sent(self):
+        """A reply is sent only after all confirmations, even if a batch is queued while another is being sent."""
+        async def run():
+            self.bot.loop = asyncio.get_running_loop()
+            self.cog._ack(self.ctx, "A")  # Sent from 0.5s to 1.5s
+            await asyncio.sleep(0.6)
+            self.cog._ack(self.ctx, "B")  # Timer runs out at 1.1s, while A is still being sent
+            await asyncio.sleep(1)
+            await self.cog._reply(self.ctx, "reply")
+
+        asyncio.run(run())
+        self.assertEqual(self.events, [
+            ("start", "A"), ("end", "A"),
+            ("start", "B"), ("end", "B"),
+            ("start", "reply"), ("end", "reply"),
+        ])
+        self.assertEqual(self.cog._sending_acks, {})
@@ -25,6 +25,12 @@ class ChecksTests(unittest.TestCase):
         self.ctx.author.roles.append(MockRole(id=10))
         self.assertTrue(checks.with_role_check(self.ctx, 10))
 
+    def test_with_role_set_check_with_guild_and_required_role(self):
+        """`with_role_set_check` returns `True` if `Context.author` has one of the roles in the set."""
+        self.ctx.author.roles.append(MockRole(id=10))
+        self.assertTrue(checks.with_role_set_check(self.ctx, frozenset({10, 20})))
+        self.assertFalse(checks.with_role_set_check(self.ctx, frozenset({20})))
+
     def test_without_role_check_without_guild(self):
         """`without_role_check` should return `False` when `Context.guild` is None."""
         self.ctx.guild = None
@@ -0,0 +1,80 @@
+import datetime
+import unittest
+from unittest.mock import patch
+
+# `bot.utils.infractions` and the moderation cogs import each other, the cogs have to be imported first
+import bot.cogs.moderation  # noqa: F401
+from bot.utils import infractions
+from tests.helpers import MockUser
+
+
+class InfractionsCacheTests(unittest.TestCase):
+    """Tests the cache of user infractions in `bot.utils.infractions`."""
+
+    def setUp(self):
+        infractions._infractions_cache.clear()
+        self.addCleanup(infractions._infractions_cache.clear)
+
+        sqlite_patcher = patch("bot.utils.infractions.SQLite")
+        self.sqlite = sqlite_patcher.start()
+        self.addCleanup(sqlite_patcher.stop)
+        self.db = self.sqlite.return_value
+        self.db.cur.fetchall.return_value = [
+            (1, "warn", "reason", 2, datetime.datetime.now(), 0, 1, 10),
+        ]
+        self.db.cur.fetchone.return_value = (11, )
+
+        monotonic_patcher = patch("bot.utils.infractions.monotonic", return_value=100)
+        self.monotonic = monotonic_patcher.start()
+        self.addCleanup(monotonic_patcher.stop)
+
+        self.user = MockUser(id=1)
+
+    def test_cache_hit_within_ttl(self):
+        """`get_infractions` doesn't query the database again before the cached infractions expire."""
+        first = infractions.get_infractions(self.user)
+        self.monotonic.return_value = 100 + infractions.INFRACTIONS_CACHE_TTL - 1
+        second = infractions.get_infractions(self.user)
+
+        self.assertEqual(self.db.execute.call_count, 1)
+        self.assertEqual([inf.id for inf in first], [inf.id for inf in second])
+
+    def test_refetch_after_expiry(self):
+        """`get_infractions` queries the database again once the cached infractions expire."""
+        infractions.get_infractions(self.user)
+        self.monotonic.return_value = 100 + infractions.INFRACTIONS_CACHE_TTL
+        infractions.get_infractions(self.user)
+
+        self.assertEqual(self.db.execute.call_count, 2)
+
+    def test_least_recently_used_user_is_evicted(self):
+        """The least recently used user is dropped from the cache once `INFRACTIONS_CACHE_SIZE` is exceeded."""
+        with patch("bot.utils.infractions.INFRACTIONS_CACHE_SIZE", 2):
+            infractions.get_infractions(MockUser(id=1))
+            infractions.get_infractions(MockUser(id=2))
+            # Mark user 1 as recently used, so that user 2 gets evicted
+            infractions.get_infractions(MockUser(id=1))
+            infractions.get_infractions(MockUser(id=3))
+
+        self.assertEqual(list(infractions._infractions_cache), [1, 3])
+
+    def test_changes_invalidate_cache(self):
+        """Adding, deactivating or removing an infraction drops the cached infractions of its user."""
+        changes = (
+            ("add_to_database", lambda inf: inf.add_to_database()),
+            ("make_inactive", lambda inf: inf.make_inactive()),
+            ("remove_infraction", infractions.remove_infraction),
+        )
+
+        for name, change in changes:
+            with self.subTest(change=name):
+                infraction = infractions.get_infractions(self.user)[0]
+                self.assertIn(self.user.id, infractions._infractions_cache)
+
+                change(infraction)
+                self.assertNotIn(self.user.id, infractions._infractions_cache)
+
+    def test_get_infractions_returns_copy(self):
+        """Modifying the list returned by `get_infractions` doesn't change the cached infractions."""
+        infractions.get_infractions(self.user).clear()
+        self.assertEqual(len(infractions.get_infractions(self.user)), 1)